@@ -1,6 +1,9 @@
 import csv
 import os
 
+import csv_helpers
+import game_logging
+
 
 def sort_cap_key(cap):
     text = str(cap)
@@ -12,15 +15,10 @@ def sort_cap_key(cap):
 
 
 def build_penalties_text(penalties):
-    penalty_entries = []
-
-    for p in penalties:
-        team_prefix = "W" if p["team"] == "White" else "B"
-        penalty_entries.append(
-            f"{team_prefix}#{p['cap']}({p['duration']})"
-        )
-
-    return ", ".join(penalty_entries)
+    return ", ".join(
+        f"{'W' if p['team'] == 'White' else 'B'}#{p['cap']}({p['duration']})"
+        for p in penalties
+    )
 
 
 def build_scorer_comments(record_scorers, white_goal_scorers, black_goal_scorers):
@@ -74,72 +72,98 @@ def write_game_results_to_csv(
         black_goal_scorers
     )
 
-    rows = []
-
-    with open(csv_file, "r", newline="", encoding="utf-8-sig") as f:
-        reader = csv.reader(f)
-        for row in reader:
-            rows.append(row)
+    data = csv_helpers.load_csv(csv_file)
+    header_row = data["header"]
+    data_rows = data["rows"]
+    columns = data["columns"]
 
-    if not rows:
+    if not header_row:
         if debug_mode:
             print("CSV UPDATE: CSV file is empty")
         return False
 
-    header = [str(h).strip() for h in rows[0]]
-
-    try:
-        wscore_col = header.index("WScore")
-        bscore_col = header.index("BScore")
-        penalties_col = header.index("Penalties")
-        comments_col = header.index("Comments")
+    wscore_col = columns["white_score"]
+    bscore_col = columns["black_score"]
+    penalties_col = columns["penalties"]
+    comments_col = columns["comments"]
 
+    if -1 in (wscore_col, bscore_col, penalties_col, comments_col):
         if debug_mode:
             print(
-                f"CSV COLUMNS: "
-                f"WScore={wscore_col} "
-                f"BScore={bscore_col} "
-                f"Penalties={penalties_col} "
-                f"Comments={comments_col}"
+                "CSV UPDATE: Missing required column "
+                "(WScore, BScore, Penalties or Comments)"
             )
+        return False
+
+    if debug_mode:
+        print(
+            f"CSV COLUMNS: "
+            f"WScore={wscore_col} "
+            f"BScore={bscore_col} "
+            f"Penalties={penalties_col} "
+            f"Comments={comments_col}"
+        )
 
-    except ValueError as e:
+    try:
+        row_index = data["game_index"].get(str(int(game_number)))
+    except (TypeError, ValueError):
+        row_index = None
+
+    if row_index is None:
         if debug_mode:
-            print(f"CSV UPDATE: Missing required column: {e}")
+            print(f"CSV UPDATE: Game {game_number} not found")
         return False
 
-    game_found = False
+    # The cached rows are shared with the parsers, so edit a copy of
+    # the one row being updated.
+    old_row = data_rows[row_index]
+    row = list(old_row)
 
-    for row in rows[1:]:
-        if len(row) < len(header):
-            row.extend([""] * (len(header) - len(row)))
+    if len(row) < len(header_row):
+        row.extend([""] * (len(header_row) - len(row)))
 
-        game_col = row[1].strip()
+    row[wscore_col] = str(white_score)
+    row[bscore_col] = str(black_score)
+    row[penalties_col] = penalties_text
+    row[comments_col] = comments_text
 
-        if game_col == str(game_number):
-            row[wscore_col] = str(white_score)
-            row[bscore_col] = str(black_score)
-            row[penalties_col] = penalties_text
-            row[comments_col] = comments_text
+    if debug_mode:
+        print("ROW AFTER:", row)
+        print(
+            f"CSV UPDATE: Game {game_number} "
+            f"W:{white_score} B:{black_score}"
+        )
 
-            if debug_mode:
-                print("ROW AFTER:", row)
-                print(
-                    f"CSV UPDATE: Game {game_number} "
-                    f"W:{white_score} B:{black_score}"
-                )
+    if row == old_row:
+        # Re-recording an unchanged result; leave the file untouched.
+        if debug_mode:
+            print("CSV UPDATE: Row unchanged, nothing to write")
+        return True
 
-            game_found = True
-            break
+    # Write to a temporary file and swap it in, so a crash mid-write
+    # cannot leave a truncated tournament sheet behind.
+    temp_file = csv_file + ".tmp"
 
-    if not game_found:
-        if debug_mode:
-            print(f"CSV UPDATE: Game {game_number} not found")
-        return False
+    new_rows = data_rows[:row_index] + [row] + data_rows[row_index + 1:]
 
-    with open(csv_file, "w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.writer(f)
-        writer.writerows(rows)
+    try:
+        with open(temp_file, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f)
+            writer.writerow(header_row)
+            writer.writerows(new_rows)
+
+        os.replace(temp_file, csv_file)
+    except Exception:
+        # Don't leave a partial temporary file next to the sheet.
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+        raise
+
+    # Only score, penalty and comment cells changed, so the game index
+    # still holds; keep the rows in memory instead of re-parsing.
+    csv_helpers.store_csv(csv_file, dict(data, rows=new_rows))
 
     if debug_mode:
         print("CSV UPDATE: Success")
@@ -218,7 +242,7 @@ def aggregate_goal_scorers(goal_events):
     return scorers
 
 def get_goal_events_for_game(base_dir, game_number):
-    txt_file = os.path.join(base_dir, "UWH_Game_Data.txt")
+    txt_file = game_logging.get_event_log_path(base_dir)
     goal_events = []
 
     if not os.path.exists(txt_file):
@@ -254,7 +278,7 @@ def get_goal_events_for_game(base_dir, game_number):
     return goal_events
 
 def get_goal_events_for_game(base_dir, game_number):
-    txt_file = os.path.join(base_dir, "UWH_Game_Data.txt")
+    txt_file = game_logging.get_event_log_path(base_dir)
     goal_events = []
 
     if not os.path.exists(txt_file):
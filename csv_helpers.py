@@ -1,5 +1,147 @@
+import csv
 import os
 
+import csv_ui
+
+
+GAME_NUMBER_COLUMNS = frozenset(("#", "game", "game#", "game_number"))
+
+# Header aliases (lower-cased) for each column the app reads or writes.
+HEADER_COLUMNS = {
+    "game_num": GAME_NUMBER_COLUMNS,
+    "white": frozenset(("white",)),
+    "black": frozenset(("black",)),
+    "white_score": frozenset(("wscore",)),
+    "black_score": frozenset(("bscore",)),
+    "penalties": frozenset(("penalties",)),
+    "comments": frozenset(("comments",)),
+}
+
+# Reverse map from each lower-cased alias to its column key, so a
+# header cell is classified with a single dict lookup.
+_ALIAS_TO_COLUMN = {
+    alias: key
+    for key, aliases in HEADER_COLUMNS.items()
+    for alias in aliases
+}
+
+# Parsed tournament CSVs keyed on path. Each entry holds the file's
+# mtime and size so edits made outside the app are still picked up.
+_csv_cache = {}
+
+
+def build_column_index(header_row):
+    """Return {column key: index} for HEADER_COLUMNS, -1 where absent."""
+    columns = dict.fromkeys(HEADER_COLUMNS, -1)
+
+    for i, col in enumerate(header_row):
+        key = _ALIAS_TO_COLUMN.get(col.strip().lower())
+
+        if key is not None and columns[key] == -1:
+            columns[key] = i
+
+    # Older draw sheets label both score columns plain "Score", each
+    # placed straight after its team's name column.
+    for team_key, score_key in (
+        ("white", "white_score"),
+        ("black", "black_score"),
+    ):
+        score_idx = columns[team_key] + 1
+
+        if (
+            columns[score_key] == -1
+            and columns[team_key] != -1
+            and score_idx < len(header_row)
+            and header_row[score_idx].strip().lower() == "score"
+        ):
+            columns[score_key] = score_idx
+
+    return columns
+
+
+def build_game_index(rows, game_num_col_idx):
+    """Map each game number (as a normalised string) to its first row index."""
+    game_index = {}
+
+    if game_num_col_idx == -1:
+        return game_index
+
+    for i, cols in enumerate(rows):
+        if len(cols) <= game_num_col_idx:
+            continue
+
+        raw = cols[game_num_col_idx].strip()
+
+        # Plain ASCII game numbers are already normalised; only odd values
+        # such as "07", "+3" or non-ASCII digits need the int round-trip.
+        if not (raw.isascii() and raw.isdigit() and raw[0] != "0"):
+            try:
+                raw = str(int(raw))
+            except ValueError:
+                continue
+
+        game_index.setdefault(raw, i)
+
+    return game_index
+
+
+def _build_csv_data(header_row, rows):
+    columns = build_column_index(header_row)
+    game_index = build_game_index(rows, columns["game_num"])
+
+    return {
+        "header": header_row,
+        "rows": rows,
+        "columns": columns,
+        "game_index": game_index,
+        # Index keys are already unique, normalised game numbers.
+        "game_numbers": sorted(game_index, key=int),
+    }
+
+
+def load_csv(csv_path):
+    """
+    Return the parsed contents of a CSV file as a dict with header,
+    rows, columns, game_index and game_numbers. The file is only
+    re-read when it has changed since the last call. Callers must not
+    modify the returned objects.
+    """
+    stat = os.stat(csv_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    entry = _csv_cache.get(csv_path)
+
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+
+    with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header_row = next(reader, [])
+        rows = list(reader)
+
+    data = _build_csv_data(header_row, rows)
+    _csv_cache[csv_path] = (signature, data)
+
+    return data
+
+
+def store_csv(csv_path, data):
+    """
+    Record data the app has just written to csv_path, so the next
+    load_csv call does not have to re-read and re-parse the file.
+    """
+    try:
+        stat = os.stat(csv_path)
+    except OSError:
+        _csv_cache.pop(csv_path, None)
+        return
+
+    _csv_cache[csv_path] = ((stat.st_mtime_ns, stat.st_size), data)
+
+
+def invalidate_csv_cache(csv_path):
+    _csv_cache.pop(csv_path, None)
+
 
 def parse_csv_game_numbers(csv_filename, base_dir):
     """
@@ -16,63 +158,26 @@ def parse_csv_game_numbers(csv_filename, base_dir):
     try:
         csv_path = os.path.join(base_dir, csv_filename)
 
-        if not os.path.exists(csv_path):
-            return game_numbers
-
-        with open(csv_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        if len(lines) < 2:
+        # load_csv stats the file anyway, so a missing file is caught
+        # here rather than with a separate exists() check.
+        try:
+            data = load_csv(csv_path)
+        except FileNotFoundError:
             return game_numbers
 
-        header = lines[0].strip().lower()
-        header_cols = [
-            col.strip()
-            for col in header.split(",")
-        ]
-
-        game_num_col_idx = -1
-
-        for i, col in enumerate(header_cols):
-            if col in ["#", "game", "game#", "game_number"]:
-                game_num_col_idx = i
-                break
-
-        if game_num_col_idx == -1:
+        if data["columns"]["game_num"] == -1:
             print(
                 f"Warning: Could not find game number "
                 f"column in CSV {csv_filename}"
             )
             return game_numbers
 
-        for line in lines[1:]:
-            line = line.strip()
-
-            if not line:
-                continue
-
-            cols = [
-                col.strip()
-                for col in line.split(",")
-            ]
-
-            if len(cols) <= game_num_col_idx:
-                continue
-
-            try:
-                game_num = int(cols[game_num_col_idx])
-                game_numbers.append(str(game_num))
-            except ValueError:
-                pass
+        game_numbers = list(data["game_numbers"])
 
     except Exception as e:
         print(f"Error parsing CSV file {csv_filename}: {e}")
 
-    return (
-        sorted(set(game_numbers), key=int)
-        if game_numbers
-        else []
-    )
+    return game_numbers
 
 import os
 
@@ -93,33 +198,16 @@ def parse_csv_team_names(csv_filename, game_number, base_dir):
     try:
         csv_path = os.path.join(base_dir, csv_filename)
 
-        if not os.path.exists(csv_path):
+        try:
+            data = load_csv(csv_path)
+        except FileNotFoundError:
             return (None, None)
 
-        with open(csv_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        if len(lines) < 2:
-            return (None, None)
-
-        header = lines[0].strip().lower()
-
-        header_cols = [
-            col.strip()
-            for col in header.split(",")
-        ]
+        columns = data["columns"]
 
-        game_num_col_idx = -1
-        white_team_col_idx = -1
-        black_team_col_idx = -1
-
-        for i, col in enumerate(header_cols):
-            if col in ["#", "game", "game#", "game_number"]:
-                game_num_col_idx = i
-            elif col == "white":
-                white_team_col_idx = i
-            elif col == "black":
-                black_team_col_idx = i
+        game_num_col_idx = columns["game_num"]
+        white_team_col_idx = columns["white"]
+        black_team_col_idx = columns["black"]
 
         if (
             game_num_col_idx == -1
@@ -128,39 +216,27 @@ def parse_csv_team_names(csv_filename, game_number, base_dir):
         ):
             return (None, None)
 
-        for line in lines[1:]:
-            line = line.strip()
-
-            if not line:
-                continue
-
-            cols = [
-                col.strip()
-                for col in line.split(",")
-            ]
+        required_len = max(
+            game_num_col_idx,
+            white_team_col_idx,
+            black_team_col_idx
+        )
 
-            if len(cols) <= max(
-                game_num_col_idx,
-                white_team_col_idx,
-                black_team_col_idx
-            ):
-                continue
+        try:
+            row_index = data["game_index"].get(str(int(game_number)))
+        except ValueError:
+            row_index = None
 
-            try:
-                if (
-                    str(int(cols[game_num_col_idx]))
-                    == str(game_number)
-                ):
-                    white_team = cols[white_team_col_idx]
-                    black_team = cols[black_team_col_idx]
+        if row_index is None:
+            return (None, None)
 
-                    return (
-                        white_team,
-                        black_team
-                    )
+        cols = data["rows"][row_index]
 
-            except (ValueError, IndexError):
-                pass
+        if len(cols) > required_len:
+            return (
+                cols[white_team_col_idx].strip(),
+                cols[black_team_col_idx].strip()
+            )
 
     except Exception as e:
         print(
@@ -176,15 +252,4 @@ def get_csv_files(base_dir):
     Returns a sorted list of CSV files found.
     """
 
-    csv_files = []
-
-    try:
-        for filename in os.listdir(base_dir):
-            if filename.lower().endswith(".csv"):
-                csv_files.append(filename)
-
-    except Exception as e:
-        print(f"Error scanning for CSV files: {e}")
-
-    return sorted(csv_files) if csv_files else ["No CSV files found"]
-
+    return csv_ui.get_csv_files(base_dir)
@@ -1,22 +1,53 @@
 import os
 
 
+# Sorted CSV filenames per folder, keyed on the folder's modification
+# time so new or deleted tournament files are still picked up.
+_csv_files_cache = {"base_dir": None, "mtime": None, "files": None}
+
+
 def get_csv_files(base_dir):
     """
     Scan the application folder for CSV files.
     Returns a list of CSV files found.
     """
+    try:
+        mtime = os.stat(base_dir).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    if (
+        mtime is not None
+        and _csv_files_cache["files"] is not None
+        and _csv_files_cache["base_dir"] == base_dir
+        and _csv_files_cache["mtime"] == mtime
+    ):
+        csv_files = _csv_files_cache["files"]
+        return list(csv_files) if csv_files else ["No CSV files found"]
+
     csv_files = []
 
     try:
-        for filename in os.listdir(base_dir):
-            if filename.lower().endswith(".csv"):
-                csv_files.append(filename)
+        with os.scandir(base_dir) as entries:
+            for entry in entries:
+                if (
+                    entry.name.lower().endswith(".csv")
+                    and entry.is_file()
+                ):
+                    csv_files.append(entry.name)
 
     except Exception as e:
         print(f"Error scanning for CSV files: {e}")
 
-    return sorted(csv_files) if csv_files else ["No CSV files found"]
+    csv_files.sort()
+
+    if mtime is not None:
+        _csv_files_cache["base_dir"] = base_dir
+        _csv_files_cache["mtime"] = mtime
+        _csv_files_cache["files"] = csv_files
+
+    return list(csv_files) if csv_files else ["No CSV files found"]
+
 
 def refresh_csv_dropdown(app):
     if not hasattr(app, "csv_dropdown"):
@@ -1,29 +1,23 @@
-def sync_penalty_display_to_external(app):
-    """
-    Preserve the original external display sync loop.
-
-    The actual penalty display update remains in uwh.py because it is tightly
-    coupled to Tkinter widgets.
-    """
-    try:
-        app.display_window.after(
-            1000,
-            app.sync_penalty_display_to_external
-        )
+import operator
 
-    except Exception as e:
-        if getattr(app, "DEBUG_MODE", False):
-            print(f"Penalty display sync error: {e}")
 
+def set_penalty_sort_key(p):
+    """
+    Store the penalty's ordering value on the dict itself.
 
-def penalty_sort_key(p):
-    return (
+    Called whenever a penalty is created or ticks, so sorting can use a
+    C-level itemgetter instead of a Python key function.
+    """
+    p["_sortkey"] = (
         p["seconds_remaining"]
         if not p["is_rest_of_match"]
         else 999999
     )
 
 
+penalty_sort_key = operator.itemgetter("_sortkey")
+
+
 def format_penalty_label(p):
     """Return the penalty text shown on operator and display screens."""
     cap_str = f"#{p['cap']}"
@@ -1,3 +1,6 @@
+import heapq
+import re
+import subprocess
 import tkinter as tk
 import tkinter.font as tkfont
 import display_manager
@@ -852,8 +855,6 @@ def _get_monitor_geometries(app):
     # Linux/X11: xrandr gives connected monitor geometry. Wayland may not expose it.
     if not monitors:
         try:
-            import re
-            import subprocess
             output = subprocess.check_output(
                 ["xrandr", "--query"],
                 text=True,
@@ -1359,10 +1360,11 @@ def _create_full_mirror_window(app, title, monitor, aspect=(16, 9)):
             except (AttributeError, tk.TclError):
                 pass
 
-            active = sorted(
-                list(getattr(app.engine, "active_penalties", [])),
-                key=lambda item: app._penalty_sort_key(item)
-            )[:6]
+            active = heapq.nsmallest(
+                6,
+                getattr(app.engine, "active_penalties", []),
+                key=display_manager.penalty_sort_key
+            )
             for index, label in enumerate(penalty_labels):
                 if index < len(active):
                     label.config(text=display_manager.format_penalty_label(active[index]))
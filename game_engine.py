@@ -5,6 +5,9 @@ class GameEngine:
 
         self.stored_penalties = []
         self.active_penalties = []
+        # Set whenever active_penalties changes so the penalty grids
+        # only re-sort when something actually moved.
+        self.penalties_dirty = True
 
         self.white_timeouts_this_half = 0
         self.black_timeouts_this_half = 0
@@ -18,6 +21,7 @@ class GameEngine:
         self.saved_state = {}
 
         self.full_sequence = []
+        self._period_index_by_name = {}
         self.current_index = 0
 
         self.timer_running = True
@@ -55,6 +59,10 @@ class GameEngine:
     def clear_penalties(self):
         self.stored_penalties.clear()
         self.active_penalties.clear()
+        self.penalties_dirty = True
+
+    def mark_penalties_changed(self):
+        self.penalties_dirty = True
 
     # ------------------------------------------------------------------
     # Timeouts
@@ -104,6 +112,11 @@ class GameEngine:
         self.full_sequence = sequence
         self.current_index = 0
 
+        # Period names are looked up on every transition; index them once.
+        self._period_index_by_name = {}
+        for idx, period in enumerate(sequence):
+            self._period_index_by_name.setdefault(period["name"], idx)
+
     def get_current_period(self):
         if not self.full_sequence:
             return None
@@ -126,11 +139,10 @@ class GameEngine:
         return self.full_sequence[0]
 
     def find_period_index(self, name):
-        for idx, period in enumerate(self.full_sequence):
-            if period["name"] == name:
-                return idx
-
-        return len(self.full_sequence) - 1
+        return self._period_index_by_name.get(
+            name,
+            len(self.full_sequence) - 1
+        )
 
     def set_current_period(self, index):
         self.current_index = index
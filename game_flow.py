@@ -20,6 +20,7 @@ def export_and_reset_game_at_break(app):
     app.black_score_var.set(0)
 
     app.engine.stored_penalties.clear()
+    app._wake_penalty_window()
     app.clear_all_penalties()
     app.engine.clear_goal_scorers()
 
@@ -49,7 +50,7 @@ def get_current_game_number(app):
     try:
         selected_game = app.starting_game_var.get()
 
-        if selected_game and selected_game in app.game_numbers:
+        if selected_game and selected_game in app._game_num_to_idx:
             return selected_game
 
         if (
@@ -76,8 +77,10 @@ def advance_to_next_game(app):
 
     current_game = app.starting_game_var.get()
 
-    if current_game in app.game_numbers:
-        app.current_game_index = app.game_numbers.index(current_game)
+    app.current_game_index = app._game_num_to_idx.get(
+        current_game,
+        app.current_game_index
+    )
 
     # Final tournament game has been completed.
     if app.current_game_index >= len(app.game_numbers) - 1:
@@ -109,10 +112,10 @@ def on_game_selection_changed(app, event=None):
     """Keep the active game index aligned with manual selection."""
     selected_game = app.starting_game_var.get()
 
-    if selected_game in app.game_numbers:
-        app.current_game_index = app.game_numbers.index(
-            selected_game
-        )
+    app.current_game_index = app._game_num_to_idx.get(
+        selected_game,
+        app.current_game_index
+    )
 
     update_game_number_display(app)
 
@@ -190,14 +193,18 @@ def refresh_game_numbers_for_court(app):
     previous_game = app.starting_game_var.get()
 
     app.game_numbers = allowed_games
+    # Position of each game in game_numbers, so selection changes and
+    # game advances do not have to scan the list.
+    app._game_num_to_idx = {
+        game_number: index
+        for index, game_number in enumerate(allowed_games)
+    }
 
     if hasattr(app, "starting_game_dropdown"):
         app.starting_game_dropdown["values"] = app.game_numbers
 
-    if previous_game in app.game_numbers:
-        app.current_game_index = app.game_numbers.index(
-            previous_game
-        )
+    if previous_game in app._game_num_to_idx:
+        app.current_game_index = app._game_num_to_idx[previous_game]
 
     elif app.game_numbers:
         app.current_game_index = 0
@@ -1,5 +1,41 @@
 import os
-import datetime
+import atexit
+import time
+import functools
+
+
+# Long-lived, line-buffered append handles keyed by log path, so each
+# event is a single write rather than an open/write/close cycle.
+_event_log_handles = {}
+
+
+@functools.lru_cache(maxsize=None)
+def get_event_log_path(base_dir):
+    return os.path.join(base_dir, "UWH_Game_Data.txt")
+
+
+def _get_event_log_handle(txt_file):
+    handle = _event_log_handles.get(txt_file)
+
+    if handle is None or handle.closed:
+        handle = open(txt_file, "a", encoding="utf-8", buffering=1)
+        _event_log_handles[txt_file] = handle
+
+    return handle
+
+
+def close_event_log():
+    """Close any open game event log handles."""
+    while _event_log_handles:
+        _, handle = _event_log_handles.popitem()
+
+        try:
+            handle.close()
+        except Exception:
+            pass
+
+
+atexit.register(close_event_log)
 
 
 def format_court_time(court_time_seconds):
@@ -22,30 +58,25 @@ def log_game_event(
     break_status=None,
     debug_mode=False
 ):
-    now = datetime.datetime.now()
-    local_time = now.strftime("%Y-%m-%d %H:%M:%S")
+    local_time = time.strftime("%Y-%m-%d %H:%M:%S")
 
     court_time = format_court_time(court_time_seconds)
 
-    fields = [
-        local_time,
-        court_time,
-        event_type,
-        team if team else "",
-        cap_number if cap_number else "",
-        duration if duration else "",
-        break_status if break_status else ""
-    ]
+    event_line = (
+        f"{local_time}|{court_time}|{event_type}|{team or ''}|"
+        f"{cap_number or ''}|{duration or ''}|{break_status or ''}\n"
+    )
 
-    event_line = "|".join(str(field) for field in fields)
-    txt_file = os.path.join(base_dir, "UWH_Game_Data.txt")
+    txt_file = get_event_log_path(base_dir)
 
     try:
-        with open(txt_file, "a", encoding="utf-8") as f:
-            f.write(event_line + "\n")
+        _get_event_log_handle(txt_file).write(event_line)
         return True
 
     except Exception as e:
+        # Drop the handle so the next event reopens the file.
+        close_event_log()
+
         if debug_mode:
             print(f"Error logging game event: {e}")
         return False
@@ -1,4 +1,48 @@
-import tkinter as tk
+import re
+
+
+# Plain decimal numbers, optionally signed, with "." or "," as separator.
+_NUMBER_RE = re.compile(r"-?(?:\d+(?:[.,]\d*)?|[.,]\d+)")
+
+
+def parse_float_comma(value):
+    """
+    Parse a plain number that may use a comma as the decimal separator.
+    Return None for anything else, so rejecting a keystroke costs no
+    exception.
+    """
+    text = str(value).strip()
+
+    if not _NUMBER_RE.fullmatch(text):
+        return None
+
+    return float(text.replace(",", "."))
+
+
+def to_float_comma(value):
+    """Like parse_float_comma, but raise ValueError for a non-number."""
+    number = parse_float_comma(value)
+
+    if number is None:
+        raise ValueError(f"not a number: {value!r}")
+
+    return number
+
+
+def _coerce_number(value):
+    """Return value as an int or float for settings.json, or None if it is not a number."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        pass
+
+    # Same rule as the entry validators: no "nan", "inf" or exponents,
+    # which json.dumps would write out as invalid JSON.
+    return parse_float_comma(value)
+
 
 def save_game_settings(app):
     """Save current game settings to unified JSON file."""
@@ -7,23 +51,17 @@ def save_game_settings(app):
 
     for var_name, var_info in app.variables.items():
         if var_info.get("checkbox", False):
-            has_entry = False
-
-            for widget in app.widgets:
-                if widget["name"] == var_name and widget["entry"] is not None:
-                    has_entry = True
-                    break
+            widget = app._widget_by_name.get(var_name)
+            has_entry = widget is not None and widget["entry"] is not None
 
             if has_entry:
                 value = var_info.get("value", var_info["default"])
 
                 if var_name != "time_to_start_first_game":
-                    try:
-                        game_settings[var_name] = (
-                            float(value) if "." in str(value) else int(value)
-                        )
-                    except (ValueError, TypeError):
-                        game_settings[var_name] = var_info["default"]
+                    number = _coerce_number(value)
+                    game_settings[var_name] = (
+                        number if number is not None else var_info["default"]
+                    )
                 else:
                     game_settings[var_name] = value
 
@@ -37,12 +75,8 @@ def save_game_settings(app):
             value = var_info.get("value", var_info["default"])
 
             if var_name != "time_to_start_first_game":
-                try:
-                    game_settings[var_name] = (
-                        float(value) if "." in str(value) else int(value)
-                    )
-                except (ValueError, TypeError):
-                    game_settings[var_name] = value
+                number = _coerce_number(value)
+                game_settings[var_name] = number if number is not None else value
             else:
                 game_settings[var_name] = value
 
@@ -61,12 +95,8 @@ def load_game_settings(app):
         value = game_settings[var_name]
 
         has_checkbox = var_info.get("checkbox", False)
-        has_entry = False
-
-        for widget in app.widgets:
-            if widget["name"] == var_name and widget["entry"] is not None:
-                has_entry = True
-                break
+        widget = app._widget_by_name.get(var_name)
+        has_entry = widget is not None and widget["entry"] is not None
 
         if has_checkbox and has_entry:
             # Mixed checkbox + numeric-entry variables.
@@ -86,20 +116,12 @@ def load_game_settings(app):
             # Entry-only variables.
             app.variables[var_name]["value"] = str(value)
 
-        for widget in app.widgets:
-            if widget["name"] != var_name:
-                continue
-
+        if widget is not None:
             if widget["entry"] is not None:
-                widget["entry"].delete(0, tk.END)
-
                 if has_checkbox and has_entry:
-                    widget["entry"].insert(
-                        0,
-                        app.variables[var_name]["value"]
-                    )
+                    widget["var"].set(app.variables[var_name]["value"])
                 else:
-                    widget["entry"].insert(0, str(value))
+                    widget["var"].set(str(value))
 
             if widget["checkbox"] is not None:
                 if has_checkbox and has_entry:
@@ -110,5 +132,3 @@ def load_game_settings(app):
                     widget["checkbox"].set(
                         value if isinstance(value, bool) else True
                     )
-
-            break
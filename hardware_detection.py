@@ -1,9 +1,37 @@
 import os
-import subprocess
+import re
+import platform
+import glob
+import time
 import datetime
+import threading
 import serial
 import serial.tools.list_ports
 
+try:
+    import pyudev
+    PYUDEV_AVAILABLE = True
+except ImportError:
+    PYUDEV_AVAILABLE = False
+
+
+# USB vendor IDs used by supported Zigbee dongles:
+# 1a86 = WCH (CH340/CH9102), 10c4 = Silicon Labs (CP210x), 0451 = TI (CC2531).
+ZIGBEE_VENDOR_IDS = {"1a86", "10c4", "0451"}
+
+_SYSTEM = platform.system()
+
+USB_CACHE_TTL = 5.0
+
+# ts is None until the first scan and after a hotplug invalidation.
+_usb_cache = {"ts": None, "val": False}
+_usb_monitor_started = False
+
+_ZIGBEE_DONGLE_RE = re.compile(
+    r"itead|sonoff|cc2531|cc2652|silicon labs|cp210",
+    re.IGNORECASE
+)
+
 
 def load_hardware_detection_cache(load_unified_settings):
     try:
@@ -37,62 +65,144 @@ def save_hardware_detection_cache(
             print(f"Warning: Could not save hardware detection cache: {e}")
 
 
-def is_usb_dongle_connected(load_unified_settings, debug_mode=False):
-    import platform
+def _is_zigbee_usb_device(vendor_id, description):
+    if (vendor_id or "").lower() in ZIGBEE_VENDOR_IDS:
+        return True
 
-    system = platform.system()
+    return bool(description) and _ZIGBEE_DONGLE_RE.search(description) is not None
 
-    if system == "Linux":
-        try:
-            dev_dir = os.path.join(os.sep, "dev")
-            if os.path.exists(dev_dir):
-                devices = [f for f in os.listdir(dev_dir) if f.startswith("ttyUSB")]
-                if devices:
-                    return True
-        except (OSError, PermissionError):
-            pass
 
-        try:
-            result = subprocess.run(
-                ["lsusb"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode == 0:
-                usb_output = result.stdout.lower()
-                zigbee_keywords = [
-                    "itead",
-                    "sonoff",
-                    "cc2531",
-                    "cc2652",
-                    "silicon labs",
-                    "cp210"
-                ]
-
-                return any(keyword in usb_output for keyword in zigbee_keywords)
-
-        except (
-            subprocess.CalledProcessError,
-            subprocess.TimeoutExpired,
-            FileNotFoundError
-        ):
-            pass
+def _scan_usb_with_pyudev():
+    context = pyudev.Context()
+
+    for device in context.list_devices(subsystem="usb"):
+        description = f"{device.get('ID_VENDOR', '')} {device.get('ID_MODEL', '')}"
+
+        if _is_zigbee_usb_device(device.get("ID_VENDOR_ID"), description):
+            return True
+
+    return False
+
+
+def _read_sysfs_attribute(device_dir, name):
+    try:
+        with open(os.path.join(device_dir, name), "r") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _scan_usb_sysfs():
+    for device_dir in glob.glob("/sys/bus/usb/devices/*"):
+        vendor_id = _read_sysfs_attribute(device_dir, "idVendor")
+
+        if not vendor_id:
+            continue
+
+        description = (
+            f"{_read_sysfs_attribute(device_dir, 'manufacturer')} "
+            f"{_read_sysfs_attribute(device_dir, 'product')}"
+        )
+
+        if _is_zigbee_usb_device(vendor_id, description):
+            return True
+
+    return False
+
+
+def invalidate_usb_cache():
+    _usb_cache["ts"] = None
+
+
+def _start_usb_monitor(debug_mode=False):
+    """Invalidate the USB cache on hotplug events instead of waiting for the TTL."""
+    global _usb_monitor_started
+
+    if _usb_monitor_started or not PYUDEV_AVAILABLE:
+        return
+
+    _usb_monitor_started = True
 
-    elif system == "Windows":
+    def watch():
         try:
-            detection = load_hardware_detection_cache(load_unified_settings)
-            zigbee_port = detection.get("zigbee_port")
-            return bool(zigbee_port)
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by("usb")
+
+            for device in iter(monitor.poll, None):
+                if device.action in ("add", "remove"):
+                    invalidate_usb_cache()
 
         except Exception as e:
             if debug_mode:
-                print(f"USB dongle Windows check failed: {e}")
+                print(f"USB hotplug monitor stopped: {e}")
+
+    threading.Thread(target=watch, daemon=True).start()
+
+
+def is_usb_dongle_connected(load_unified_settings, debug_mode=False):
+    ts = _usb_cache["ts"]
+
+    if ts is not None and time.monotonic() - ts < USB_CACHE_TTL:
+        return _usb_cache["val"]
+
+    connected = _scan_usb_dongle(load_unified_settings, debug_mode)
+
+    _usb_cache["ts"] = time.monotonic()
+    _usb_cache["val"] = connected
+
+    return connected
+
+
+def _scan_usb_dongle_linux(load_unified_settings, debug_mode=False):
+    try:
+        dev_dir = os.path.join(os.sep, "dev")
+        with os.scandir(dev_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("ttyUSB"):
+                    return True
+    except (OSError, PermissionError):
+        pass
+
+    try:
+        if PYUDEV_AVAILABLE:
+            _start_usb_monitor(debug_mode)
+            return _scan_usb_with_pyudev()
+
+        return _scan_usb_sysfs()
 
+    except Exception as e:
+        if debug_mode:
+            print(f"USB dongle Linux scan failed: {e}")
+
+    return False
+
+
+def _scan_usb_dongle_windows(load_unified_settings, debug_mode=False):
+    try:
+        detection = load_hardware_detection_cache(load_unified_settings)
+        zigbee_port = detection.get("zigbee_port")
+        return bool(zigbee_port)
+
+    except Exception as e:
+        if debug_mode:
+            print(f"USB dongle Windows check failed: {e}")
+
+    return False
+
+
+def _scan_usb_dongle_unsupported(load_unified_settings, debug_mode=False):
     return False
 
 
+# The OS never changes while the app is running, so pick the scanner once.
+if _SYSTEM == "Linux":
+    _scan_usb_dongle = _scan_usb_dongle_linux
+elif _SYSTEM == "Windows":
+    _scan_usb_dongle = _scan_usb_dongle_windows
+else:
+    _scan_usb_dongle = _scan_usb_dongle_unsupported
+
+
 def auto_detect_com_ports(
     load_unified_settings,
     save_unified_settings,
@@ -2,6 +2,25 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 
 
+def wake_penalty_window(app):
+    """Restart the Penalties window refresh if it went idle."""
+    penalty_window = getattr(app, "penalty_window", None)
+
+    if penalty_window is None:
+        return
+
+    try:
+        if not penalty_window.winfo_exists():
+            app.penalty_window = None
+            return
+
+        if getattr(penalty_window, "_idle", False):
+            penalty_window._idle = False
+            penalty_window.after(1000, penalty_window._periodic_refresh)
+    except tk.TclError:
+        app.penalty_window = None
+
+
 def show_penalties(app, trigger_button=None):
     """Show the penalties dialog window."""
     penalty_width = 250
@@ -155,10 +174,23 @@ def show_penalties(app, trigger_button=None):
         try:
             if penalty_window.winfo_exists():
                 refresh_penalty_listbox()
-                penalty_window.after(1000, periodic_refresh)
+
+                # Only keep ticking while a timed penalty is counting down.
+                if any(
+                    not penalty["is_rest_of_match"]
+                    for penalty in app.engine.active_penalties
+                ):
+                    penalty_window._idle = False
+                    penalty_window.after(1000, periodic_refresh)
+                else:
+                    penalty_window._idle = True
         except tk.TclError:
             pass
 
+    penalty_window._idle = False
+    penalty_window._periodic_refresh = periodic_refresh
+    app.penalty_window = penalty_window
+
     penalty_window.after(1000, periodic_refresh)
 
     def start_penalty():
@@ -250,6 +282,7 @@ def show_penalties(app, trigger_button=None):
     )
 
     def on_close():
+        app.penalty_window = None
         penalty_window.destroy()
 
     ttk.Button(
@@ -3,233 +3,192 @@ from tkinter import ttk
 from tkinter import messagebox
 import time
 
+import game_settings_manager
 
-def open_button_dialog(app, idx, trigger_button=None):
-    dialog_width = 400
-    dialog_height = 700
-    gap = 8
+# How long a preset validation error stays under the preset buttons.
+PRESET_ERROR_DISPLAY_MS = 4000
 
-    dlg = tk.Toplevel(app.master)
-    dlg.withdraw()
-    dlg.title(f"Button {idx + 1} Settings")
-    dlg.resizable(False, False)
-    dlg.transient(app.master)
 
-    entries = {}
-    checks = {}
-    row_num = 0
-    max_btn_text_len = 16
+# Fallback entry values for the first preset when it has none stored.
+_FIRST_PRESET_ENTRY_DEFAULTS = {
+    "team_timeout_period": "1",
+    "half_period": "15",
+    "half_time_break": "3",
+    "overtime_game_break": "3",
+    "overtime_half_period": "5",
+    "overtime_half_time_break": "1",
+    "sudden_death_game_break": "1",
+    "between_game_break": "5",
+    "crib_time": "60"
+}
 
-    tk.Label(
-        dlg,
-        text="Button Display Text:"
-    ).grid(row=row_num, column=0, sticky="w", padx=6, pady=4)
+# Checkboxes that are always ticked in the first preset's dialog.
+_FIRST_PRESET_CHECKED = frozenset({"team_timeouts_allowed", "overtime_allowed"})
 
-    btn_text_var = tk.StringVar(
-        value=app.button_data[idx].get("text", str(idx + 1))
-    )
+_MAX_BTN_TEXT_LEN = 16
 
-    text_entry = ttk.Entry(
-        dlg,
-        textvariable=btn_text_var,
-        width=max_btn_text_len
-    )
-    text_entry.grid(row=row_num, column=1, sticky="w", padx=6, pady=4)
 
-    row_num += 1
+def preset_dialog_values(app, idx):
+    """Return the button text, entry values and checkbox values for preset idx."""
+    data = app.button_data[idx]
+    entry_values = {}
+    check_values = {}
 
     for widget in app.widgets:
         var_name = widget["name"]
-        label = widget["label_widget"]
 
         if var_name in ["time_to_start_first_game", "start_first_game_in"]:
             continue
 
         if var_name == "sudden_death_game_break":
-            tk.Label(
-                dlg,
-                text="Sudden Death Allowed?"
-            ).grid(row=row_num, column=0, sticky="w", padx=6, pady=4)
-
-            default_checkbox_val = app.variables[var_name].get("used", True)
-
-            check_value = app.button_data[idx]["checkboxes"].get(
+            check_values[var_name] = data["checkboxes"].get(
                 var_name,
-                default_checkbox_val
-            )
-
-            check_var = tk.BooleanVar(value=check_value)
-
-            ttk.Checkbutton(
-                dlg,
-                variable=check_var
-            ).grid(
-                row=row_num,
-                column=1,
-                sticky="w",
-                padx=6,
-                pady=4
+                app.variables[var_name].get("used", True)
             )
-
-            checks[var_name] = check_var
-            row_num += 1
-
-            tk.Label(
-                dlg,
-                text="Sudden Death Game Break:"
-            ).grid(row=row_num, column=0, sticky="w", padx=6, pady=4)
-
-            sudden_death_value = app.button_data[idx]["values"].get(
+            entry_values[var_name] = data["values"].get(
                 "sudden_death_game_break",
                 "1"
             )
-
-            sudden_death_entry_var = tk.StringVar(
-                value=sudden_death_value
-            )
-
-            ttk.Entry(
-                dlg,
-                textvariable=sudden_death_entry_var,
-                width=10
-            ).grid(
-                row=row_num,
-                column=1,
-                sticky="w",
-                padx=6,
-                pady=4
-            )
-
-            entries["sudden_death_game_break"] = sudden_death_entry_var
-            row_num += 1
             continue
 
-        tk.Label(
-            dlg,
-            text=label.cget("text")
-        ).grid(row=row_num, column=0, sticky="w", padx=6, pady=4)
-
         if widget["checkbox"] is not None:
-            if idx == 0 and var_name in [
-                "team_timeouts_allowed",
-                "overtime_allowed"
-            ]:
-                check_value = True
+            if idx == 0 and var_name in _FIRST_PRESET_CHECKED:
+                check_values[var_name] = True
             else:
-                default_checkbox_val = app.variables[var_name].get(
-                    "used",
-                    True
-                )
-
-                check_value = app.button_data[idx]["checkboxes"].get(
+                check_values[var_name] = data["checkboxes"].get(
                     var_name,
-                    default_checkbox_val
+                    app.variables[var_name].get("used", True)
                 )
 
-            check_var = tk.BooleanVar(value=check_value)
-
-            ttk.Checkbutton(
-                dlg,
-                variable=check_var
-            ).grid(
-                row=row_num,
-                column=1,
-                sticky="w",
-                padx=6,
-                pady=4
-            )
-
-            checks[var_name] = check_var
-
         else:
-            if idx == 0 and var_name in [
-                "team_timeout_period",
-                "half_period",
-                "half_time_break",
-                "overtime_game_break",
-                "overtime_half_period",
-                "overtime_half_time_break",
-                "sudden_death_game_break",
-                "between_game_break",
-                "crib_time"
-            ]:
-                default_values = {
-                    "team_timeout_period": "1",
-                    "half_period": "15",
-                    "half_time_break": "3",
-                    "overtime_game_break": "3",
-                    "overtime_half_period": "5",
-                    "overtime_half_time_break": "1",
-                    "sudden_death_game_break": "1",
-                    "between_game_break": "5",
-                    "crib_time": "60"
-                }
-
-                value = app.button_data[idx]["values"].get(
-                    var_name,
-                    default_values.get(
-                        var_name,
-                        str(app.variables[var_name]["default"])
-                    )
-                )
-            else:
-                default_entry_value = str(
-                    app.variables[var_name]["default"]
-                )
+            default_entry_value = str(app.variables[var_name]["default"])
 
-                value = app.button_data[idx]["values"].get(
+            if idx == 0:
+                default_entry_value = _FIRST_PRESET_ENTRY_DEFAULTS.get(
                     var_name,
                     default_entry_value
                 )
 
-            entry_var = tk.StringVar(value=value)
-
-            ttk.Entry(
-                dlg,
-                textvariable=entry_var,
-                width=10
-            ).grid(
-                row=row_num,
-                column=1,
-                sticky="w",
-                padx=6,
-                pady=4
+            entry_values[var_name] = data["values"].get(
+                var_name,
+                default_entry_value
             )
 
-            entries[var_name] = entry_var
+    entry_values["crib_time"] = data["values"].get("crib_time", "60")
+
+    return data.get("text", str(idx + 1)), entry_values, check_values
 
-        row_num += 1
+
+def build_button_dialog(app):
+    """
+    Build the preset editing dialog once, hidden.
+
+    The rows follow app.widgets, which is fixed once the settings tab
+    is built, so later opens only reload the values for the chosen
+    preset. Returns the dialog state dict stored as app._preset_dialog.
+    """
+    dlg = tk.Toplevel(app.master)
+    dlg.withdraw()
+    dlg.resizable(False, False)
+    dlg.transient(app.master)
+
+    state = {
+        "dlg": dlg,
+        "idx": None,
+        "text_var": tk.StringVar(),
+        "entries": {},
+        "checks": {},
+        "saved": None
+    }
+    entries = state["entries"]
+    checks = state["checks"]
+    row_num = 0
 
     tk.Label(
         dlg,
-        text="Crib Time (seconds):"
+        text="Button Display Text:"
     ).grid(row=row_num, column=0, sticky="w", padx=6, pady=4)
 
-    crib_time_value = app.button_data[idx]["values"].get(
-        "crib_time",
-        "60"
+    text_entry = ttk.Entry(
+        dlg,
+        textvariable=state["text_var"],
+        width=_MAX_BTN_TEXT_LEN
     )
+    text_entry.grid(row=row_num, column=1, sticky="w", padx=6, pady=4)
 
-    crib_time_entry_var = tk.StringVar(value=crib_time_value)
+    row_num += 1
 
-    ttk.Entry(
-        dlg,
-        textvariable=crib_time_entry_var,
-        width=10
-    ).grid(
-        row=row_num,
-        column=1,
-        sticky="w",
-        padx=6,
-        pady=4
-    )
+    def add_check_row(var_name, text):
+        tk.Label(
+            dlg,
+            text=text
+        ).grid(row=row_num, column=0, sticky="w", padx=6, pady=4)
+
+        check_var = tk.BooleanVar()
+
+        ttk.Checkbutton(
+            dlg,
+            variable=check_var
+        ).grid(
+            row=row_num,
+            column=1,
+            sticky="w",
+            padx=6,
+            pady=4
+        )
+
+        checks[var_name] = check_var
+
+    def add_entry_row(var_name, text):
+        tk.Label(
+            dlg,
+            text=text
+        ).grid(row=row_num, column=0, sticky="w", padx=6, pady=4)
 
-    entries["crib_time"] = crib_time_entry_var
+        entry_var = tk.StringVar()
+
+        ttk.Entry(
+            dlg,
+            textvariable=entry_var,
+            width=10
+        ).grid(
+            row=row_num,
+            column=1,
+            sticky="w",
+            padx=6,
+            pady=4
+        )
+
+        entries[var_name] = entry_var
+
+    for widget in app.widgets:
+        var_name = widget["name"]
+
+        if var_name in ["time_to_start_first_game", "start_first_game_in"]:
+            continue
+
+        if var_name == "sudden_death_game_break":
+            add_check_row(var_name, "Sudden Death Allowed?")
+            row_num += 1
+            add_entry_row(var_name, "Sudden Death Game Break:")
+            row_num += 1
+            continue
+
+        label_text = widget["label_widget"].cget("text")
+
+        if widget["checkbox"] is not None:
+            add_check_row(var_name, label_text)
+        else:
+            add_entry_row(var_name, label_text)
+
+        row_num += 1
+
+    add_entry_row("crib_time", "Crib Time (seconds):")
     row_num += 1
 
     def get_dialog_state():
         return {
-            "text": btn_text_var.get(),
+            "text": state["text_var"].get(),
             "entries": {
                 name: value.get()
                 for name, value in entries.items()
@@ -240,14 +199,13 @@ def open_button_dialog(app, idx, trigger_button=None):
             }
         }
 
-    saved_dialog_state = get_dialog_state()
+    state["get_state"] = get_dialog_state
 
     def has_unsaved_changes():
-        return get_dialog_state() != saved_dialog_state
+        return get_dialog_state() != state["saved"]
 
     def save_changes():
-        nonlocal saved_dialog_state
-
+        idx = state["idx"]
         new_values = {}
 
         for var_name, entry_var in entries.items():
@@ -259,9 +217,7 @@ def open_button_dialog(app, idx, trigger_button=None):
 
             value = entry_var.get().strip().replace(",", ".")
 
-            try:
-                float(value)
-            except ValueError:
+            if game_settings_manager.parse_float_comma(value) is None:
                 messagebox.showerror(
                     "Invalid Value",
                     f"'{value}' is not a valid number for "
@@ -280,24 +236,15 @@ def open_button_dialog(app, idx, trigger_button=None):
                 check_var.get()
             )
 
-        new_button_text = btn_text_var.get()[:max_btn_text_len]
-        btn_text_var.set(new_button_text)
+        new_button_text = state["text_var"].get()[:_MAX_BTN_TEXT_LEN]
+        state["text_var"].set(new_button_text)
 
         app.button_data[idx]["text"] = new_button_text
 
-        try:
-            # This updates the visible preset button and saves all preset data.
-            app.set_widget2_button_text(idx, new_button_text)
-
-        except Exception as e:
-            messagebox.showerror(
-                "Save Error",
-                f"Could not save preset settings:\n{e}",
-                parent=dlg
-            )
-            return
+        # This updates the visible preset button and queues a preset save.
+        app.set_widget2_button_text(idx, new_button_text)
 
-        saved_dialog_state = get_dialog_state()
+        state["saved"] = get_dialog_state()
 
     def close_dialog():
         if has_unsaved_changes():
@@ -316,7 +263,7 @@ def open_button_dialog(app, idx, trigger_button=None):
         except tk.TclError:
             pass
 
-        dlg.destroy()
+        dlg.withdraw()
 
     button_frame = ttk.Frame(dlg)
     button_frame.grid(
@@ -352,6 +299,34 @@ def open_button_dialog(app, idx, trigger_button=None):
 
     dlg.protocol("WM_DELETE_WINDOW", close_dialog)
 
+    return state
+
+
+def open_button_dialog(app, idx, trigger_button=None):
+    dialog_width = 400
+    dialog_height = 700
+    gap = 8
+
+    state = app._preset_dialog
+
+    if state is None or not state["dlg"].winfo_exists():
+        state = app._preset_dialog = build_button_dialog(app)
+
+    dlg = state["dlg"]
+    dlg.title(f"Button {idx + 1} Settings")
+
+    text, entry_values, check_values = preset_dialog_values(app, idx)
+    state["idx"] = idx
+    state["text_var"].set(text)
+
+    for var_name, value in entry_values.items():
+        state["entries"][var_name].set(value)
+
+    for var_name, value in check_values.items():
+        state["checks"][var_name].set(value)
+
+    state["saved"] = state["get_state"]()
+
     dlg.update_idletasks()
 
     if trigger_button:
@@ -376,7 +351,7 @@ def open_button_dialog(app, idx, trigger_button=None):
 
 
 def start_button_hold(app, event, idx):
-    app._button_hold_start_time = time.time()
+    app._button_hold_start_time = time.monotonic()
     app._button_hold_index = idx
     app._button_hold_widget = event.widget
 
@@ -390,17 +365,13 @@ def start_button_hold(app, event, idx):
 
 
 def button_release(app, event, idx):
-    if (
-        hasattr(app, "_button_hold_timer")
-        and app._button_hold_timer is not None
-    ):
+    if app._button_hold_timer is not None:
         app.master.after_cancel(app._button_hold_timer)
         app._button_hold_timer = None
 
     if (
-        hasattr(app, "_button_hold_start_time")
-        and app._button_hold_start_time is not None
-        and (time.time() - app._button_hold_start_time < 2.9)
+        app._button_hold_start_time is not None
+        and (time.monotonic() - app._button_hold_start_time < 2.9)
     ):
         app._apply_button_data(idx)
 
@@ -408,7 +379,31 @@ def button_release(app, event, idx):
     app._button_hold_index = None
 
 
+def show_preset_error(app, message):
+    """Show message under the preset buttons for a few seconds."""
+    app.preset_error_label.config(text=message)
+
+    if app._preset_error_clear_id is not None:
+        app.master.after_cancel(app._preset_error_clear_id)
+
+    app._preset_error_clear_id = app.master.after(
+        PRESET_ERROR_DISPLAY_MS,
+        lambda: clear_preset_error(app)
+    )
+
+
+def clear_preset_error(app):
+    if app._preset_error_clear_id is not None:
+        app.master.after_cancel(app._preset_error_clear_id)
+        app._preset_error_clear_id = None
+
+    app.preset_error_label.config(text="")
+
+
 def apply_button_data(app, idx):
+    # Entry text written below, so validation need not read it back from Tk.
+    entry_text = {}
+
     for widget in app.widgets:
         var_name = widget["name"]
 
@@ -431,71 +426,52 @@ def apply_button_data(app, idx):
                 widget["entry"].get()
             )
 
-            widget["entry"].delete(0, tk.END)
-            widget["entry"].insert(0, value)
+            widget["var"].set(value)
+            entry_text[var_name] = value
 
     crib_time_value = app.button_data[idx]["values"].get(
         "crib_time",
         None
     )
 
-    if crib_time_value is not None:
-        for widget in app.widgets:
-            if (
-                widget["name"] == "crib_time"
-                and widget["entry"] is not None
-            ):
-                widget["entry"].delete(0, tk.END)
-                widget["entry"].insert(0, crib_time_value)
-
-    crib_time_seconds = None
-    between_game_break_minutes = None
-
-    for widget in app.widgets:
-        if (
-            widget["name"] == "crib_time"
-            and widget["entry"] is not None
-        ):
-            try:
-                crib_time_seconds = float(
-                    widget["entry"].get().strip().replace(",", ".")
-                )
-            except (ValueError, AttributeError):
-                pass
+    crib_widget = app._widget_by_name.get("crib_time")
+    if crib_widget is None or crib_widget["entry"] is None:
+        crib_widget = None
+        crib_time_text = None
+    elif crib_time_value is None:
+        crib_time_text = crib_widget["entry"].get()
+    else:
+        crib_time_text = crib_time_value
 
-        elif widget["name"] == "between_game_break":
-            try:
-                between_game_break_minutes = float(
-                    widget["entry"].get().strip().replace(",", ".")
-                )
-            except (ValueError, AttributeError):
-                pass
+    crib_time_seconds = game_settings_manager.parse_float_comma(
+        crib_time_text
+    )
+    between_game_break_minutes = game_settings_manager.parse_float_comma(
+        entry_text.get("between_game_break")
+    )
 
     if (
         crib_time_seconds is not None
         and between_game_break_minutes is not None
         and (between_game_break_minutes * 60) - crib_time_seconds <= 31
     ):
-        for widget in app.widgets:
-            if (
-                widget["name"] == "crib_time"
-                and widget["entry"] is not None
-            ):
-                widget["entry"].delete(0, tk.END)
-                widget["entry"].insert(
-                    0,
-                    app.last_valid_values.get("crib_time", "60")
-                )
+        crib_widget["var"].set(app.last_valid_values.get("crib_time", "60"))
 
-        messagebox.showerror(
-            "Input Error",
+        show_preset_error(
+            app,
             "Crib time too large. Between Game Break minus "
             "Crib time must be more than 31 seconds."
         )
         return
 
-    app.load_settings()
-    app.build_game_sequence()
+    # The crib entry is only touched once the preset's value has passed.
+    if crib_widget is not None and crib_time_value is not None:
+        crib_widget["var"].set(crib_time_value)
+
+    # A valid preset replaces any error left by the previous one.
+    clear_preset_error(app)
+
+    app._load_settings_and_build_sequence()
 
 
 def set_widget2_button_text(app, idx, new_text):
@@ -2,20 +2,146 @@ import tkinter as tk
 from tkinter import ttk
 
 
+# Tk's grid accepts a list of indices, so every row/column can be
+# configured in a single call rather than one call per index.
+SCOREBOARD_ROWS = tuple(range(11))
+SCOREBOARD_COLUMNS = tuple(range(9))
+
+_TIMEOUT_BUTTON_OPTIONS = {
+    "justify": "center",
+    "wraplength": 180,
+    "height": 2,
+}
+
+# Scoreboard control buttons, created in this order (which is also the
+# keyboard focus order). Colours of None come from the app instead,
+# e.g. the referee button's default colours.
+SCOREBOARD_BUTTONS = [
+    {
+        "attr": "white_timeout_button",
+        "text": "White Team\nTime-Out",
+        "font": "timeout_button",
+        "colours": ("white", "black"),
+        "grid": {"row": 9, "column": 0, "rowspan": 2, "columnspan": 1},
+        "command": lambda app: app.white_team_timeout,
+        "options": _TIMEOUT_BUTTON_OPTIONS,
+    },
+    {
+        "attr": "white_goal_button",
+        "text": "Add Goal White",
+        "font": "button",
+        "colours": ("lightgrey", "black"),
+        "grid": {"row": 9, "column": 1, "columnspan": 2},
+        "command": lambda app: lambda: app.add_goal_with_confirmation(
+            app.white_score_var,
+            "White",
+            app.white_goal_button
+        ),
+    },
+    {
+        "attr": "referee_timeout_button",
+        "text": "Referee Time-Out",
+        "font": "button",
+        "colours": None,
+        "grid": {"row": 9, "column": 3, "columnspan": 3},
+        "command": lambda app: app.toggle_referee_timeout,
+    },
+    {
+        "attr": "black_goal_button",
+        "text": "Add Goal Black",
+        "font": "button",
+        "colours": ("lightgrey", "black"),
+        "grid": {"row": 9, "column": 6, "columnspan": 2},
+        "command": lambda app: lambda: app.add_goal_with_confirmation(
+            app.black_score_var,
+            "Black",
+            app.black_goal_button
+        ),
+    },
+    {
+        "attr": "black_timeout_button",
+        "text": "Black Team\nTime-Out",
+        "font": "timeout_button",
+        "colours": ("black", "white"),
+        "grid": {"row": 9, "column": 8, "rowspan": 2, "columnspan": 1},
+        "command": lambda app: app.black_team_timeout,
+        "options": _TIMEOUT_BUTTON_OPTIONS,
+    },
+    {
+        "attr": "white_minus_button",
+        "text": "-ve Goal White",
+        "font": "button",
+        "colours": ("lightgrey", "black"),
+        "grid": {"row": 10, "column": 1, "columnspan": 2},
+        "command": lambda app: lambda: app.adjust_score_with_confirm(
+            app.white_score_var,
+            "White"
+        ),
+    },
+    {
+        "attr": "penalties_button",
+        "text": "Penalties",
+        "font": "button",
+        "colours": ("orange", "black"),
+        "grid": {"row": 10, "column": 3, "columnspan": 3},
+        "command": lambda app: lambda: app.show_penalties(app.penalties_button),
+    },
+    {
+        "attr": "black_minus_button",
+        "text": "-ve Goal Black",
+        "font": "button",
+        "colours": ("lightgrey", "black"),
+        "grid": {"row": 10, "column": 6, "columnspan": 2},
+        "command": lambda app: lambda: app.adjust_score_with_confirm(
+            app.black_score_var,
+            "Black"
+        ),
+    },
+]
+
+
+def _create_scoreboard_button(app, tab, spec):
+    if spec["colours"] is None:
+        colour_options = app._ref_off_cfg
+    else:
+        bg, fg = spec["colours"]
+        colour_options = {
+            "bg": bg,
+            "fg": fg,
+            "activebackground": bg,
+            "activeforeground": fg,
+        }
+
+    button = tk.Button(
+        tab,
+        text=spec["text"],
+        font=app.fonts[spec["font"]],
+        command=spec["command"](app),
+        **colour_options,
+        **spec.get("options", {})
+    )
+    button.grid(
+        padx=1,
+        pady=1,
+        sticky="nsew",
+        **spec["grid"]
+    )
+    setattr(app, spec["attr"], button)
+
+    return button
+
+
 def create_scoreboard_tab(app):
     tab = ttk.Frame(app.notebook)
     app.scoreboard_tab = tab
     app.notebook.add(tab, text="Scoreboard")
 
-    for i in range(11):
-        tab.grid_rowconfigure(i, weight=1)
-
-    for i in range(9):
-        tab.grid_columnconfigure(
-            i,
-            weight=1,
-            uniform="scoreboard_cols"
-        )
+    tab.grid_rowconfigure(SCOREBOARD_ROWS, weight=1)
+    tab.grid_columnconfigure(
+        SCOREBOARD_COLUMNS,
+        weight=1,
+        uniform="scoreboard_cols"
+    )
 
     # Keep the penalties row and Game Number row at a fixed height.
     # This stops the display shifting when penalty boxes appear or disappear.
@@ -242,178 +368,7 @@ def create_scoreboard_tab(app):
     )
     app.referee_timeout_timer_label.grid_remove()
 
-    app.white_timeout_button = tk.Button(
-        tab,
-        text="White Team\nTime-Out",
-        font=app.fonts["timeout_button"],
-        bg="white",
-        fg="black",
-        activebackground="white",
-        activeforeground="black",
-        justify="center",
-        wraplength=180,
-        height=2,
-        command=app.white_team_timeout
-    )
-    app.white_timeout_button.grid(
-        row=9,
-        column=0,
-        rowspan=2,
-        columnspan=1,
-        padx=1,
-        pady=1,
-        sticky="nsew"
-    )
-
-    app.white_goal_button = tk.Button(
-        tab,
-        text="Add Goal White",
-        font=app.fonts["button"],
-        bg="lightgrey",
-        fg="black",
-        activebackground="lightgrey",
-        activeforeground="black",
-        command=lambda: app.add_goal_with_confirmation(
-            app.white_score_var,
-            "White",
-            app.white_goal_button
-        )
-    )
-    app.white_goal_button.grid(
-        row=9,
-        column=1,
-        columnspan=2,
-        padx=1,
-        pady=1,
-        sticky="nsew"
-    )
-
-    app.referee_timeout_button = tk.Button(
-        tab,
-        text="Referee Time-Out",
-        font=app.fonts["button"],
-        bg=app.referee_timeout_default_bg,
-        fg=app.referee_timeout_default_fg,
-        activebackground=app.referee_timeout_default_bg,
-        activeforeground=app.referee_timeout_default_fg,
-        command=app.toggle_referee_timeout
-    )
-    app.referee_timeout_button.grid(
-        row=9,
-        column=3,
-        columnspan=3,
-        padx=1,
-        pady=1,
-        sticky="nsew"
-    )
-
-    app.black_goal_button = tk.Button(
-        tab,
-        text="Add Goal Black",
-        font=app.fonts["button"],
-        bg="lightgrey",
-        fg="black",
-        activebackground="lightgrey",
-        activeforeground="black",
-        command=lambda: app.add_goal_with_confirmation(
-            app.black_score_var,
-            "Black",
-            app.black_goal_button
-        )
-    )
-    app.black_goal_button.grid(
-        row=9,
-        column=6,
-        columnspan=2,
-        padx=1,
-        pady=1,
-        sticky="nsew"
-    )
-
-    app.black_timeout_button = tk.Button(
-        tab,
-        text="Black Team\nTime-Out",
-        font=app.fonts["timeout_button"],
-        bg="black",
-        fg="white",
-        activebackground="black",
-        activeforeground="white",
-        justify="center",
-        wraplength=180,
-        height=2,
-        command=app.black_team_timeout
-    )
-    app.black_timeout_button.grid(
-        row=9,
-        column=8,
-        rowspan=2,
-        columnspan=1,
-        padx=1,
-        pady=1,
-        sticky="nsew"
-    )
-
-    app.white_minus_button = tk.Button(
-        tab,
-        text="-ve Goal White",
-        font=app.fonts["button"],
-        bg="lightgrey",
-        fg="black",
-        activebackground="lightgrey",
-        activeforeground="black",
-        command=lambda: app.adjust_score_with_confirm(
-            app.white_score_var,
-            "White"
-        )
-    )
-    app.white_minus_button.grid(
-        row=10,
-        column=1,
-        columnspan=2,
-        padx=1,
-        pady=1,
-        sticky="nsew"
-    )
-
-    app.penalties_button = tk.Button(
-        tab,
-        text="Penalties",
-        font=app.fonts["button"],
-        bg="orange",
-        fg="black",
-        activebackground="orange",
-        activeforeground="black",
-        command=lambda: app.show_penalties(app.penalties_button)
-    )
-    app.penalties_button.grid(
-        row=10,
-        column=3,
-        columnspan=3,
-        padx=1,
-        pady=1,
-        sticky="nsew"
-    )
-
-    app.black_minus_button = tk.Button(
-        tab,
-        text="-ve Goal Black",
-        font=app.fonts["button"],
-        bg="lightgrey",
-        fg="black",
-        activebackground="lightgrey",
-        activeforeground="black",
-        command=lambda: app.adjust_score_with_confirm(
-            app.black_score_var,
-            "Black"
-        )
-    )
-    app.black_minus_button.grid(
-        row=10,
-        column=6,
-        columnspan=2,
-        padx=1,
-        pady=1,
-        sticky="nsew"
-    )
+    for spec in SCOREBOARD_BUTTONS:
+        _create_scoreboard_button(app, tab, spec)
 
     app.update_team_timeouts_allowed()
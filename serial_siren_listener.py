@@ -62,7 +62,7 @@ def save_hardware_ports_to_json(arduino_port, zigbee_port):
         }
 
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2)
+            f.write(json.dumps(settings, indent=2))
 
         _debug(
             f"Saved hardware detection cache: "
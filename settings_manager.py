@@ -1,17 +1,39 @@
 import os
 import json
+import copy
+import functools
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
+# In-memory copy of the last settings.json read or written, keyed on the
+# file's modification time so external edits are still picked up.
+_SETTINGS_CACHE = {"path": None, "mtime": None, "data": None, "blob": None}
+
+
+@functools.lru_cache(maxsize=None)
 def get_settings_path(base_dir):
     return os.path.join(base_dir, "settings.json")
 
 
+@functools.lru_cache(maxsize=None)
+def get_legacy_settings_paths(base_dir):
+    return (
+        os.path.join(base_dir, "game_settings.json"),
+        os.path.join(base_dir, "zigbee_config.json"),
+    )
+
+
 def migrate_legacy_settings(base_dir):
     """Migrate settings from legacy separate files to unified settings.json."""
     unified_settings = get_default_unified_settings()
     migrated = False
 
-    legacy_sound_file = os.path.join(base_dir, "game_settings.json")
+    legacy_sound_file, legacy_zigbee_file = get_legacy_settings_paths(base_dir)
+
     if os.path.exists(legacy_sound_file):
         try:
             with open(legacy_sound_file, "r") as f:
@@ -24,7 +46,6 @@ def migrate_legacy_settings(base_dir):
         except Exception as e:
             print(f"Error migrating game_settings.json: {e}")
 
-    legacy_zigbee_file = os.path.join(base_dir, "zigbee_config.json")
     if os.path.exists(legacy_zigbee_file):
         try:
             with open(legacy_zigbee_file, "r") as f:
@@ -37,37 +58,115 @@ def migrate_legacy_settings(base_dir):
         except Exception as e:
             print(f"Error migrating zigbee_config.json: {e}")
 
+    # Write once when there is no settings.json yet (or something was
+    # migrated), so later loads read it instead of the legacy files.
+    if migrated or not os.path.exists(get_settings_path(base_dir)):
+        try:
+            save_unified_settings(base_dir, unified_settings)
+        except OSError as e:
+            print(f"Error writing settings.json: {e}")
+
     if migrated:
-        save_unified_settings(base_dir, unified_settings)
         print("Migration completed. Legacy files preserved.")
 
     return unified_settings
 
 
+def _get_mtime(settings_path):
+    try:
+        return os.stat(settings_path).st_mtime
+    except OSError:
+        return None
+
+
+def _settings_blob(settings):
+    # sort_keys gives a stable form; unlike dict equality it also tells
+    # True apart from 1.
+    return json.dumps(settings, sort_keys=True)
+
+
+def _update_settings_cache(settings_path, settings, blob=None):
+    _SETTINGS_CACHE["path"] = settings_path
+    _SETTINGS_CACHE["mtime"] = _get_mtime(settings_path)
+    _SETTINGS_CACHE["data"] = copy.deepcopy(settings)
+    _SETTINGS_CACHE["blob"] = blob if blob is not None else _settings_blob(settings)
+
+
 def load_unified_settings(base_dir):
     """Load unified settings from JSON file."""
     settings_path = get_settings_path(base_dir)
+    mtime = _get_mtime(settings_path)
+
+    if mtime is None:
+        return migrate_legacy_settings(base_dir)
 
-    if os.path.exists(settings_path):
+    if (
+        _SETTINGS_CACHE["data"] is not None
+        and _SETTINGS_CACHE["path"] == settings_path
+        and _SETTINGS_CACHE["mtime"] == mtime
+    ):
+        return copy.deepcopy(_SETTINGS_CACHE["data"])
+
+    try:
         with open(settings_path, "r") as f:
-            try:
-                return json.load(f)
-            except Exception:
-                return migrate_legacy_settings(base_dir)
+            settings = json.load(f)
+    except Exception as e:
+        print(f"Error reading settings.json: {e}")
+        # Keep the unreadable file for inspection rather than overwriting it.
+        try:
+            os.replace(settings_path, settings_path + ".corrupt")
+            print("Moved unreadable settings.json to settings.json.corrupt")
+        except OSError as e:
+            print(f"Error backing up settings.json: {e}")
+        return migrate_legacy_settings(base_dir)
 
-    return migrate_legacy_settings(base_dir)
+    _update_settings_cache(settings_path, settings)
+    return settings
 
 
 def save_unified_settings(base_dir, settings):
     """Save unified settings to JSON file."""
     settings_path = get_settings_path(base_dir)
+    blob = _settings_blob(settings)
 
-    with open(settings_path, "w") as f:
-        json.dump(settings, f, indent=2)
+    # Skip the write when settings.json already holds exactly this content.
+    if (
+        _SETTINGS_CACHE["path"] == settings_path
+        and _SETTINGS_CACHE["blob"] == blob
+        and _SETTINGS_CACHE["mtime"] is not None
+        and _SETTINGS_CACHE["mtime"] == _get_mtime(settings_path)
+    ):
+        return
 
+    temp_path = settings_path + ".tmp"
 
-def get_default_unified_settings():
-    """Get default unified settings structure."""
+    # Write to a temporary file and rename it over settings.json so an
+    # interrupted save can never leave a half-written settings file.
+    try:
+        if ORJSON_AVAILABLE:
+            with open(temp_path, "wb") as f:
+                f.write(orjson.dumps(settings, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            with open(temp_path, "w") as f:
+                f.write(json.dumps(settings, indent=2))
+                f.flush()
+                os.fsync(f.fileno())
+
+        os.replace(temp_path, settings_path)
+    except Exception:
+        # Don't leave a partial temporary file next to settings.json.
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    _update_settings_cache(settings_path, settings, blob)
+
+
+def _build_default_unified_settings():
     return {
         "soundSettings": {
             "pips_sound": "Default",
@@ -139,6 +238,15 @@ def get_default_unified_settings():
     }
 
 
+# Built once; callers get a deep copy because they modify the result.
+_DEFAULT_SETTINGS = _build_default_unified_settings()
+
+
+def get_default_unified_settings():
+    """Get default unified settings structure."""
+    return copy.deepcopy(_DEFAULT_SETTINGS)
+
+
 def load_sound_settings(base_dir):
     """Load sound settings from unified JSON file."""
     unified_settings = load_unified_settings(base_dir)
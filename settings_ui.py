@@ -3,6 +3,41 @@ import tkinter as tk
 from tkinter import ttk, font, messagebox
 import re
 
+import game_settings_manager
+
+# 24-hour H:MM or HH:MM, e.g. 9:36 or 19:36. Also used by
+# build_game_sequence, so both accept the same start times.
+HHMM_RE = re.compile(r"(?:[0-9]|1[0-9]|2[0-3]):[0-5][0-9]")
+
+# Rows shown first, and the row placed just before crib_time.
+_LEADING_ENTRIES = ("time_to_start_first_game", "start_first_game_in")
+_BEFORE_CRIB_ENTRY = "record_scorers_cap_number"
+
+
+def build_entry_order(variables):
+    """
+    Return the Game Variables row order as a tuple.
+
+    The start-time rows lead, the scorer cap-number toggle sits just
+    before crib_time, and everything else keeps its definition order.
+    """
+    special = set(_LEADING_ENTRIES) | {_BEFORE_CRIB_ENTRY}
+    entry_order = [name for name in variables if name not in special]
+
+    crib_time_index = (
+        entry_order.index("crib_time")
+        if "crib_time" in entry_order
+        else len(entry_order)
+    )
+
+    return tuple(
+        list(_LEADING_ENTRIES)
+        + entry_order[:crib_time_index]
+        + [_BEFORE_CRIB_ENTRY]
+        + entry_order[crib_time_index:]
+    )
+
+
 def create_settings_tab(app):
     tab = ttk.Frame(app.notebook)
     app.notebook.add(tab, text="Game Variables")
@@ -14,64 +49,49 @@ def create_settings_tab(app):
     tab.grid_columnconfigure(0, weight=2)
     tab.grid_columnconfigure(1, weight=1)
 
+    # Read the default font once; every cget() is a Tcl round-trip and
+    # the same few tuples are reused for each settings row.
     default_font = font.nametofont("TkDefaultFont")
-    new_size = default_font.cget("size") + 2
-    small_size = default_font.cget("size") - 1
+    family = default_font.cget("family")
+    base_size = default_font.cget("size")
+    new_size = base_size + 2
+    small_size = base_size - 1
+    body_font = (family, base_size)
+    large_font = (family, new_size)
+    header_font = (family, new_size, "bold")
+    button_font = (family, base_size + 1, "bold")
+    small_font = (family, small_size)
+    small_bold_font = (family, small_size, "bold")
     headers = ["Use?", "Variable", "Value", "Units"]
 
     style = ttk.Style()
     style.configure(
         "Large.TCheckbutton",
         focuscolor="none",
-        font=(default_font.cget("family"), default_font.cget("size") + 2)
+        font=large_font
     )
 
     # ------------------------------------------------------------
     # Widget 1 - Game Variables
     # ------------------------------------------------------------
+    # widget1 is only placed in the tab once all of its rows exist, so
+    # Tk lays the frame out once instead of after every child .grid().
     widget1 = ttk.Frame(tab, borderwidth=1, relief="solid")
-    widget1.grid(row=0, column=0, rowspan=4, sticky="nsew", padx=8, pady=8)
 
-    for i in range(4):
-        widget1.grid_columnconfigure(i, weight=1)
-
-    for i in range(17):
-        widget1.grid_rowconfigure(i, weight=1)
+    widget1.grid_columnconfigure(tuple(range(4)), weight=1)
+    widget1.grid_rowconfigure(tuple(range(17)), weight=1)
 
     for i, h in enumerate(headers):
         tk.Label(
             widget1,
             text=h,
-            font=(default_font.cget("family"), new_size, "bold")
+            font=header_font
         ).grid(row=0, column=i, sticky="w", padx=5, pady=4)
 
     row_idx = 1
     app.widgets = []
 
-    entry_order = list(app.variables.keys())
-
-    for special_name in [
-        "time_to_start_first_game",
-        "start_first_game_in",
-        "record_scorers_cap_number"
-    ]:
-        if special_name in entry_order:
-            entry_order.remove(special_name)
-
-    crib_time_index = (
-        entry_order.index("crib_time")
-        if "crib_time" in entry_order
-        else len(entry_order)
-    )
-
-    entry_order = (
-        ["time_to_start_first_game", "start_first_game_in"]
-        + entry_order[:crib_time_index]
-        + ["record_scorers_cap_number"]
-        + entry_order[crib_time_index:]
-    )
-
-    for var_name in entry_order:
+    for var_name in app._settings_entry_order:
         var_info = app.variables[var_name]
 
         if (
@@ -96,7 +116,7 @@ def create_settings_tab(app):
             label_widget = tk.Label(
                 widget1,
                 text=var_info.get("label", "Team Time-Outs allowed?"),
-                font=(default_font.cget("family"), new_size, "bold")
+                font=header_font
             )
             label_widget.grid(row=row_idx, column=1, sticky="w", pady=4)
 
@@ -108,6 +128,7 @@ def create_settings_tab(app):
             app.widgets.append({
                 "name": var_name,
                 "entry": None,
+                "var": None,
                 "checkbox": check_var,
                 "label_widget": label_widget
             })
@@ -127,7 +148,7 @@ def create_settings_tab(app):
             label_widget = tk.Label(
                 widget1,
                 text=var_info.get("label", "Overtime allowed?"),
-                font=(default_font.cget("family"), new_size, "bold")
+                font=header_font
             )
             label_widget.grid(row=row_idx, column=1, sticky="w", pady=4)
 
@@ -139,6 +160,7 @@ def create_settings_tab(app):
             app.widgets.append({
                 "name": var_name,
                 "entry": None,
+                "var": None,
                 "checkbox": check_var,
                 "label_widget": label_widget
             })
@@ -158,7 +180,7 @@ def create_settings_tab(app):
             label_widget = tk.Label(
                 widget1,
                 text=var_info.get("label", "Record Scorers Cap Number"),
-                font=(default_font.cget("family"), new_size, "bold")
+                font=header_font
             )
             label_widget.grid(row=row_idx, column=1, sticky="w", pady=4)
 
@@ -172,6 +194,7 @@ def create_settings_tab(app):
             app.widgets.append({
                 "name": var_name,
                 "entry": None,
+                "var": None,
                 "checkbox": check_var,
                 "label_widget": label_widget
             })
@@ -201,14 +224,18 @@ def create_settings_tab(app):
         label_widget = tk.Label(
             widget1,
             text=label_text,
-            font=(default_font.cget("family"), new_size, "bold")
+            font=header_font
         )
         label_widget.grid(row=row_idx, column=1, sticky="w", pady=4)
 
-        entry = ttk.Entry(widget1, width=10)
+        # Entries are driven through their StringVar, so code that fills
+        # them in (presets, loaded settings) needs one set() per entry.
+        entry_var = tk.StringVar(
+            value="" if var_name == "time_to_start_first_game" else "1"
+        )
+        entry = ttk.Entry(widget1, width=10, textvariable=entry_var)
 
         if var_name == "time_to_start_first_game":
-            entry.insert(0, "")
 
             def validate_hhmm_on_focusout(event):
                 val = event.widget.get().strip()
@@ -216,10 +243,7 @@ def create_settings_tab(app):
                 if val == "":
                     return
 
-                if not re.fullmatch(
-                    r"(?:[0-9]|1[0-9]|2[0-3]):[0-5][0-9]",
-                    val
-                ):
+                if not HHMM_RE.fullmatch(val):
                     messagebox.showerror(
                         "Input Error",
                         "Please enter time in HH:MM 24-hour format "
@@ -235,8 +259,6 @@ def create_settings_tab(app):
             entry.bind("<Return>", validate_hhmm_on_focusout)
 
         else:
-            entry.insert(0, "1")
-
             if var_name in ["crib_time", "sudden_death_game_break"]:
 
                 def validate_numeric_on_focusout(event, field_name=var_name):
@@ -245,52 +267,9 @@ def create_settings_tab(app):
                     if val == "":
                         return
 
-                    try:
-                        val_normalized = val.replace(",", ".")
-                        val_float = float(val_normalized)
-
-                        if field_name == "crib_time":
-                            between_game_break_minutes = None
-
-                            for widget in app.widgets:
-                                if widget["name"] == "between_game_break":
-                                    try:
-                                        bgb_val = (
-                                            widget["entry"]
-                                            .get()
-                                            .strip()
-                                            .replace(",", ".")
-                                        )
-                                        between_game_break_minutes = float(bgb_val)
-                                    except (ValueError, AttributeError):
-                                        pass
-                                    break
-
-                            if between_game_break_minutes is not None:
-                                crib_time_seconds = val_float
-
-                                if (
-                                    between_game_break_minutes * 60
-                                ) - crib_time_seconds <= 31:
-                                    messagebox.showerror(
-                                        "Input Error",
-                                        "Crib time too large. Between Game "
-                                        "Break minus Crib time must be > "
-                                        "31 seconds."
-                                    )
-                                    event.widget.delete(0, tk.END)
-                                    event.widget.insert(
-                                        0,
-                                        app.last_valid_values[field_name]
-                                    )
-                                    event.widget.focus_set()
-                                    event.widget.selection_range(0, tk.END)
-                                    return
-
-                        app.last_valid_values[field_name] = val
-                        app._on_single_variable_change(field_name)
-
-                    except ValueError:
+                    val_float = game_settings_manager.parse_float_comma(val)
+
+                    if val_float is None:
                         messagebox.showerror(
                             "Input Error",
                             f"Please enter a valid number for "
@@ -303,6 +282,36 @@ def create_settings_tab(app):
                         )
                         event.widget.focus_set()
                         event.widget.selection_range(0, tk.END)
+                        return
+
+                    if field_name == "crib_time":
+                        between_game_break_minutes = (
+                            app._validated_numeric.get("between_game_break")
+                        )
+
+                        if between_game_break_minutes is not None:
+                            crib_time_seconds = val_float
+
+                            if (
+                                between_game_break_minutes * 60
+                            ) - crib_time_seconds <= 31:
+                                messagebox.showerror(
+                                    "Input Error",
+                                    "Crib time too large. Between Game "
+                                    "Break minus Crib time must be > "
+                                    "31 seconds."
+                                )
+                                event.widget.delete(0, tk.END)
+                                event.widget.insert(
+                                    0,
+                                    app.last_valid_values[field_name]
+                                )
+                                event.widget.focus_set()
+                                event.widget.selection_range(0, tk.END)
+                                return
+
+                    app.last_valid_values[field_name] = val
+                    app._on_single_variable_change(field_name)
 
                 entry.bind("<FocusOut>", validate_numeric_on_focusout)
                 entry.bind("<Return>", validate_numeric_on_focusout)
@@ -322,12 +331,13 @@ def create_settings_tab(app):
         tk.Label(
             widget1,
             text=var_info["unit"],
-            font=(default_font.cget("family"), new_size, "bold")
+            font=header_font
         ).grid(row=row_idx, column=3, sticky="w", padx=5, pady=4)
 
         app.widgets.append({
             "name": var_name,
             "entry": entry,
+            "var": entry_var,
             "checkbox": check_var,
             "label_widget": label_widget
         })
@@ -351,7 +361,7 @@ def create_settings_tab(app):
                     "• Value boxes accept decimal time e.g. 1.5 or 1,5 = "
                     "1 min, 30 sec"
                 ),
-                font=(default_font.cget("family"), small_size),
+                font=small_font,
                 anchor="w",
                 justify="left",
                 wraplength=600
@@ -372,7 +382,7 @@ def create_settings_tab(app):
                     "• If you change any value in here, push the "
                     "'Reset Timer' Button!"
                 ),
-                font=(default_font.cget("family"), small_size, "bold"),
+                font=small_bold_font,
                 fg="red",
                 anchor="w",
                 justify="left",
@@ -388,6 +398,17 @@ def create_settings_tab(app):
 
             row_idx += 1
 
+    app._widget_by_name = {w["name"]: w for w in app.widgets}
+    app._overtime_widgets = [
+        app._widget_by_name[name]
+        for name in (
+            "overtime_game_break",
+            "overtime_half_period",
+            "overtime_half_time_break"
+        )
+        if name in app._widget_by_name
+    ]
+
     app.reset_timer_button = ttk.Button(
         widget1,
         text="Reset Timer",
@@ -400,6 +421,8 @@ def create_settings_tab(app):
         pady=8
     )
 
+    widget1.grid(row=0, column=0, rowspan=4, sticky="nsew", padx=8, pady=8)
+
     # ------------------------------------------------------------
     # Widget 2 - Presets
     # ------------------------------------------------------------
@@ -419,7 +442,7 @@ def create_settings_tab(app):
     header_label = tk.Label(
         widget2,
         text="Presets",
-        font=(default_font.cget("family"), new_size, "bold")
+        font=header_font
     )
     header_label.grid(
         row=0,
@@ -441,11 +464,7 @@ def create_settings_tab(app):
         btn = tk.Button(
             widget2,
             text=app.button_data[i]["text"],
-            font=(
-                default_font.cget("family"),
-                default_font.cget("size") + 1,
-                "bold"
-            ),
+            font=button_font,
             width=12,
             height=1,
             relief="raised",
@@ -460,17 +479,36 @@ def create_settings_tab(app):
             sticky="nsew"
         )
 
-        btn.bind("<ButtonPress-1>", app._make_press_handler(i))
-        btn.bind("<ButtonRelease-1>", app._make_release_handler(i))
+        btn._preset_index = i
+        btn.bind("<ButtonPress-1>", app._on_preset_press)
+        btn.bind("<ButtonRelease-1>", app._on_preset_release)
 
         app.widget2_buttons.append(btn)
 
+    # Preset validation errors are shown here rather than in a modal
+    # dialog, so a preset tapped mid-game never blocks the clock.
+    app.preset_error_label = tk.Label(
+        widget2,
+        text="",
+        fg="red",
+        anchor="w",
+        justify="left",
+        font=body_font
+    )
+    app.preset_error_label.grid(
+        row=3,
+        column=0,
+        columnspan=3,
+        sticky="w",
+        padx=8
+    )
+
     instruction1 = tk.Label(
         widget2,
         text="Click the buttons above to load preset times and allowed Game Periods",
         anchor="w",
         justify="left",
-        font=(default_font.cget("family"), default_font.cget("size"))
+        font=body_font
     )
     instruction1.grid(
         row=4,
@@ -486,7 +524,7 @@ def create_settings_tab(app):
         text="Press and hold the button for >4 seconds to alter the stored preset values",
         anchor="w",
         justify="left",
-        font=(default_font.cget("family"), default_font.cget("size"))
+        font=body_font
     )
     instruction2.grid(
         row=5,
@@ -518,7 +556,7 @@ def create_settings_tab(app):
     tournament_header = tk.Label(
         widget4,
         text="Tournament List",
-        font=(default_font.cget("family"), new_size, "bold")
+        font=header_font
     )
     tournament_header.grid(
         row=0,
@@ -589,6 +627,8 @@ def create_settings_tab(app):
         "<<ComboboxSelected>>",
         app.on_csv_file_changed
     )
+    app.csv_var.trace_add("write", app._on_csv_var_changed)
+    app._on_csv_var_changed()
 
     # ------------------------------------------------------------
     # Open Folder button — promoted to the tournament CSV line
@@ -596,10 +636,7 @@ def create_settings_tab(app):
     open_folder_btn = tk.Button(
         widget4,
         text="Open Folder",
-        font=(
-            default_font.cget("family"),
-            default_font.cget("size")
-        ),
+        font=body_font,
         command=app.open_csv_folder,
         width=12
     )
@@ -617,10 +654,7 @@ def create_settings_tab(app):
     tk.Label(
         widget4,
         text="Starting Game #:",
-        font=(
-            default_font.cget("family"),
-            default_font.cget("size")
-        ),
+        font=body_font,
         anchor="w"
     ).grid(
         row=2,
@@ -660,10 +694,7 @@ def create_settings_tab(app):
     tk.Label(
         widget4,
         text="This court uses numbers:",
-        font=(
-            default_font.cget("family"),
-            default_font.cget("size")
-        ),
+        font=body_font,
         anchor="w"
     ).grid(
         row=2,
@@ -707,7 +738,7 @@ def create_settings_tab(app):
             "Referees,Penalties,Comments\n"
             "(where # is the Game Number)"
         ),
-        font=(default_font.cget("family"), small_size),
+        font=small_font,
         anchor="nw",
         justify="left",
         wraplength=600
@@ -734,7 +765,7 @@ def create_settings_tab(app):
     explanation_header = tk.Label(
         widget3,
         text="Game Sequence",
-        font=(default_font.cget("family"), new_size, "bold")
+        font=header_font
     )
     explanation_header.grid(
         row=0,
@@ -760,7 +791,7 @@ def create_settings_tab(app):
     explanation_label = tk.Label(
         widget3,
         text=explanation_text,
-        font=(default_font.cget("family"), small_size),
+        font=small_font,
         justify="left",
         anchor="nw"
     )
@@ -789,8 +820,11 @@ def create_screen_tab(app):
     outer.grid_columnconfigure(0, weight=1)
 
     default_font = font.nametofont("TkDefaultFont")
-    title_font = (default_font.cget("family"), default_font.cget("size") + 4, "bold")
-    label_font = (default_font.cget("family"), default_font.cget("size") + 2, "bold")
+    family = default_font.cget("family")
+    base_size = default_font.cget("size")
+    title_font = (family, base_size + 4, "bold")
+    label_font = (family, base_size + 2, "bold")
+    body_font = (family, base_size)
 
     tk.Label(outer, text="Screen Configuration", font=title_font).grid(
         row=0, column=0, sticky="w", pady=(0, 14)
@@ -908,7 +942,7 @@ def create_screen_tab(app):
         textvariable=app.detected_screens_var,
         justify="left",
         anchor="nw",
-        font=("Consolas", default_font.cget("size")),
+        font=("Consolas", base_size),
         wraplength=900,
     ).grid(row=0, column=0, sticky="ew")
 
@@ -923,6 +957,6 @@ def create_screen_tab(app):
         justify="left",
         anchor="nw",
         wraplength=900,
-        font=(default_font.cget("family"), default_font.cget("size"))
+        font=body_font
     ).grid(row=6, column=0, sticky="w", pady=(4, 0))
 
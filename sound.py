@@ -172,30 +172,53 @@ def handle_no_audio_device_warning(
     sound_var.set("")
     return audio_device_warning_shown
 
-def get_sound_files():
-    sound_files = []
-    supported_extensions = [".wav", ".mp3"]
+# Sorted sound filenames from the assets folder, keyed on the folder's
+# modification time so added or removed files are still picked up.
+_sound_files_cache = {"mtime": None, "files": None}
+
+
+def get_available_sound_files():
+    """Return the sorted sound filenames in assets, or an empty list."""
+    supported_extensions = (".wav", ".mp3")
 
     try:
         assets_dir = resource_path("assets")
 
-        if os.path.exists(assets_dir):
-            for filename in os.listdir(assets_dir):
-                file_path = os.path.join(assets_dir, filename)
+        try:
+            mtime = os.stat(assets_dir).st_mtime
+        except OSError:
+            return []
+
+        if (
+            _sound_files_cache["files"] is not None
+            and _sound_files_cache["mtime"] == mtime
+        ):
+            return list(_sound_files_cache["files"])
 
+        sound_files = []
+
+        with os.scandir(assets_dir) as entries:
+            for entry in entries:
                 if (
-                    os.path.isfile(file_path)
-                    and any(
-                        filename.lower().endswith(ext)
-                        for ext in supported_extensions
-                    )
+                    entry.is_file()
+                    and entry.name.lower().endswith(supported_extensions)
                 ):
-                    sound_files.append(filename)
+                    sound_files.append(entry.name)
+
+        sound_files.sort()
+        _sound_files_cache["mtime"] = mtime
+        _sound_files_cache["files"] = sound_files
+
+        return list(sound_files)
 
     except Exception as e:
         print(f"Error scanning for sound files: {e}")
+        return []
 
-    return sorted(sound_files) if sound_files else ["No sound files found"]
+
+def get_sound_files():
+    sound_files = get_available_sound_files()
+    return sound_files if sound_files else ["No sound files found"]
 
 
 def preload_sounds():
@@ -205,9 +228,9 @@ def preload_sounds():
         print("pygame.mixer not available - sounds will not be preloaded")
         return 0
 
-    sound_files = get_sound_files()
+    sound_files = get_available_sound_files()
 
-    if sound_files == ["No sound files found"]:
+    if not sound_files:
         print("No sound files found to preload")
         return 0
 
@@ -5,7 +5,7 @@ from tkinter import messagebox, ttk
 
 from sound import (
     check_audio_device_available,
-    get_sound_files,
+    get_available_sound_files,
     play_sound_with_volume,
     resource_path,
 )
@@ -43,9 +43,7 @@ def create_sounds_tab(app):
 
     # The dropdowns contain only actual files with the required text
     # in their names. "Default" is not added to either list.
-    sound_files = get_sound_files()
-    if sound_files == ["No sound files found"]:
-        sound_files = []
+    sound_files = get_available_sound_files()
 
     pips_options = [
         filename
@@ -92,8 +90,20 @@ def create_sounds_tab(app):
         sound_var.set("")
         return False
 
+    def volume_label_updater(label, volume_var):
+        """Return a handler that rewrites label only when the percentage changes."""
+        shown = [label.cget("text")]
+
+        def update(event=None):
+            text = f"{volume_var.get()}%"
+            if text != shown[0]:
+                shown[0] = text
+                label.config(text=text)
+
+        return update
+
     def open_sounds_folder():
-        """Open the same assets folder that get_sound_files() scans."""
+        """Open the same assets folder that get_available_sound_files() scans."""
         sounds_folder = resource_path("assets")
 
         try:
@@ -263,12 +273,16 @@ def create_sounds_tab(app):
     )
     pips_vol_label.grid(row=3, column=3, sticky="w")
 
+    # Dragging only moves the label; the audio-device probe runs
+    # aplay/amixer, so it is left to the press and release events.
+    update_pips_vol_label = volume_label_updater(pips_vol_label, app.pips_volume)
+
     def on_pips_slider_interaction(event=None):
-        pips_vol_label.config(text=f"{app.pips_volume.get()}%")
+        update_pips_vol_label()
         ensure_audio_device(app.pips_var, "pips")
 
     pips_vol_slider.bind("<Button-1>", on_pips_slider_interaction)
-    pips_vol_slider.bind("<B1-Motion>", on_pips_slider_interaction)
+    pips_vol_slider.bind("<B1-Motion>", update_pips_vol_label)
     pips_vol_slider.bind(
         "<ButtonRelease-1>",
         on_pips_slider_interaction
@@ -353,12 +367,17 @@ def create_sounds_tab(app):
     )
     siren_vol_label.grid(row=6, column=3, sticky="w")
 
+    update_siren_vol_label = volume_label_updater(
+        siren_vol_label,
+        app.siren_volume
+    )
+
     def on_siren_slider_interaction(event=None):
-        siren_vol_label.config(text=f"{app.siren_volume.get()}%")
+        update_siren_vol_label()
         ensure_audio_device(app.siren_var, "siren")
 
     siren_vol_slider.bind("<Button-1>", on_siren_slider_interaction)
-    siren_vol_slider.bind("<B1-Motion>", on_siren_slider_interaction)
+    siren_vol_slider.bind("<B1-Motion>", update_siren_vol_label)
     siren_vol_slider.bind(
         "<ButtonRelease-1>",
         on_siren_slider_interaction
@@ -446,8 +465,10 @@ def create_sounds_tab(app):
     )
     air_vol_label.grid(row=8, column=4, sticky="n")
 
-    def on_air_slider_interaction(event=None):
-        air_vol_label.config(text=f"{app.air_volume.get()}%")
+    on_air_slider_interaction = volume_label_updater(
+        air_vol_label,
+        app.air_volume
+    )
 
     air_vol_slider.bind("<Button-1>", on_air_slider_interaction)
     air_vol_slider.bind("<B1-Motion>", on_air_slider_interaction)
@@ -480,8 +501,10 @@ def create_sounds_tab(app):
     )
     water_vol_label.grid(row=8, column=5, sticky="n")
 
-    def on_water_slider_interaction(event=None):
-        water_vol_label.config(text=f"{app.water_volume.get()}%")
+    on_water_slider_interaction = volume_label_updater(
+        water_vol_label,
+        app.water_volume
+    )
 
     water_vol_slider.bind("<Button-1>", on_water_slider_interaction)
     water_vol_slider.bind("<B1-Motion>", on_water_slider_interaction)
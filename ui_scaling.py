@@ -1,3 +1,127 @@
+from tkinter import font
+
+
+FONT_SPECS = {
+    "court_time": {"family": "Arial", "size": 36},
+    "half": {"family": "Arial", "size": 36, "weight": "bold"},
+    "team": {"family": "Arial", "size": 30, "weight": "bold"},
+    "score": {"family": "Arial", "size": 200, "weight": "bold"},
+    "timer": {"family": "Arial", "size": 110, "weight": "bold"},
+    "game_no": {"family": "Arial", "size": 20},
+    "button": {"family": "Arial", "size": 20, "weight": "bold"},
+    "timeout_button": {"family": "Arial", "size": 20, "weight": "bold"},
+    "referee_timeout_timer": {"family": "Arial", "size": 20, "weight": "bold"},
+}
+
+DISPLAY_FONT_SPECS = {
+    "court_time": {"family": "Arial", "size": 36},
+    "half": {"family": "Arial", "size": 36, "weight": "bold"},
+    "team": {"family": "Arial", "size": 30, "weight": "bold"},
+    "score": {"family": "Arial", "size": 200, "weight": "bold"},
+    "timer": {"family": "Arial", "size": 110, "weight": "bold"},
+    "game_no": {"family": "Arial", "size": 20},
+    "referee_timeout_timer": {"family": "Arial", "size": 24},
+}
+
+# Fixed-size fonts for the Zigbee Siren tab; never rescaled.
+ZIGBEE_FONT_SPECS = {
+    "label": {"family": "Arial", "size": 11},
+    "label_bold": {"family": "Arial", "size": 11, "weight": "bold"},
+    "entry": {"family": "Arial", "size": 10},
+    "small": {"family": "Arial", "size": 9},
+    "log": {"family": "Courier", "size": 9},
+}
+
+
+# Unscaled sizes at the 1200px reference width, kept as tuples so a
+# resize does not allocate a fresh dict for every event.
+_BASE_FONT_SIZES = (
+    ("court_time", 36),
+    ("half", 36),
+    ("team", 30),
+    ("score", 200),
+    ("timer", 110),
+    ("game_no", 20),
+    ("button", 20),
+    ("timeout_button", 20),
+    ("referee_timeout_timer", 24),
+)
+
+_DISPLAY_BASE_FONT_SIZES = (
+    ("court_time", 36),
+    ("half", 36),
+    ("team", 30),
+    ("score", 200),
+    ("timer", 110),
+    ("game_no", 20),
+    ("referee_timeout_timer", 24),
+)
+
+_REDUCED_KEYS = frozenset({"timeout_button"})
+_REDUCED_BUTTON_SCALE = 0.7
+
+
+class LazyFonts(dict):
+    """Font dictionary that only creates each Tk font the first time it is used."""
+
+    def __init__(self, specs):
+        super().__init__()
+        self.specs = specs
+        self.sizes = {}
+
+    def __missing__(self, key):
+        spec = dict(self.specs[key])
+
+        # Fonts created after a rescale start at the current scaled size.
+        if key in self.sizes:
+            spec["size"] = self.sizes[key]
+
+        fnt = font.Font(**spec)
+        self[key] = fnt
+        return fnt
+
+    def get(self, key, default=None):
+        if key in self or key in self.specs:
+            return self[key]
+        return default
+
+    def resize(self, key, size):
+        # Every font config() makes Tk re-layout the widgets using it,
+        # so leave fonts alone when the size has not changed.
+        if self.sizes.get(key) == size:
+            return
+
+        self.sizes[key] = size
+        fnt = dict.get(self, key)
+
+        if fnt is not None:
+            try:
+                fnt.config(size=size)
+            except Exception:
+                pass
+
+
+SCALE_DEBOUNCE_MS = 80
+
+
+def schedule_scale_fonts(app, event=None):
+    """Rescale once the window stops changing size rather than per event."""
+    if app._scale_pending:
+        try:
+            app.master.after_cancel(app._scale_pending)
+        except Exception:
+            pass
+
+    app._scale_pending = app.master.after(
+        SCALE_DEBOUNCE_MS,
+        lambda: _run_scheduled_scale(app)
+    )
+
+
+def _run_scheduled_scale(app):
+    app._scale_pending = None
+    app.scale_fonts(None)
+
 
 def scale_fonts(app, event=None):
     try:
@@ -17,32 +141,11 @@ def scale_fonts(app, event=None):
     scale = cur_width / base_width
     scale = max(0.5, min(2.0, scale))
 
-    base_sizes = {
-        "court_time": 36,
-        "half": 36,
-        "team": 30,
-        "score": 200,
-        "timer": 110,
-        "game_no": 20,
-        "button": 20,
-        "timeout_button": 20,
-        "referee_timeout_timer": 24,
-    }
-
-    reduced_button_scale = 0.7
-
-    for key, fnt in app.fonts.items():
-        if key == "timeout_button":
-            new_size = int(
-                base_sizes[key] * scale * reduced_button_scale
-            )
-        else:
-            new_size = int(base_sizes[key] * scale)
+    fonts = app.fonts
 
-        try:
-            fnt.config(size=new_size)
-        except Exception:
-            pass
+    for key, base in _BASE_FONT_SIZES:
+        factor = _REDUCED_BUTTON_SCALE if key in _REDUCED_KEYS else 1.0
+        fonts.resize(key, int(base * scale * factor))
 
 
 def scale_display_fonts(app, event=None):
@@ -63,21 +166,7 @@ def scale_display_fonts(app, event=None):
     scale = cur_width / base_width
     scale = max(0.5, min(2.0, scale))
 
-    base_sizes = {
-        "court_time": 36,
-        "half": 36,
-        "team": 30,
-        "score": 200,
-        "timer": 110,
-        "game_no": 20,
-        "referee_timeout_timer": 24,
-    }
-
-    for key, fnt in app.display_fonts.items():
-        new_size = int(base_sizes[key] * scale)
+    fonts = app.display_fonts
 
-        try:
-            fnt.config(size=new_size)
-        except Exception:
-            pass
-          
+    for key, base in _DISPLAY_BASE_FONT_SIZES:
+        fonts.resize(key, int(base * scale))
@@ -83,7 +83,7 @@ import sound
 import zigbee_siren
 import serial_siren_listener
 import tkinter as tk
-from tkinter import ttk, messagebox, font
+from tkinter import ttk, messagebox
 import datetime
 import re
 import time
@@ -91,59 +91,128 @@ import threading
 import subprocess
 import json
 import webbrowser
+import heapq
+import platform
+import types
 
 # ------------------------------------------------------------------
 # Global settings
 # ------------------------------------------------------------------
 
 DEBUG_MODE = False
+_SYSTEM = platform.system()
 
 from zigbee_siren import ZigbeeSirenController, is_mqtt_available
 from sound import (check_audio_device_available, handle_no_audio_device_warning, 
-                   get_sound_files, play_sound, play_sound_with_volume, preload_sounds)
+                   get_available_sound_files, play_sound, play_sound_with_volume, preload_sounds)
 from game_engine import GameEngine
 
 SETTINGS_FILE = "settings.json"
 
+# Strict two-digit HH:MM, used when deriving "Start First Game In".
+_STRICT_HHMM_RE = re.compile(r"(?:[01][0-9]|2[0-3]):[0-5][0-9]")
+
+# Game variables read by build_game_sequence; edits to any other
+# variable (timeouts, crib time, scorer recording) skip the rebuild.
+_SEQUENCE_VARIABLES = frozenset({
+    "time_to_start_first_game",
+    "start_first_game_in",
+    "half_period",
+    "half_time_break",
+    "overtime_allowed",
+    "overtime_game_break",
+    "overtime_half_period",
+    "overtime_half_time_break",
+    "sudden_death_game_break",
+    "between_game_break",
+})
+
+# Oldest Zigbee Activity Log lines are dropped beyond this many.
+ZIGBEE_LOG_MAX_LINES = 500
+
+# Bound format method for the once-a-second court time label.
+_COURT_TIME_FMT = "Court Time is {:02d}:{:02d}:{:02d}".format
+
+# Quiet period after the last settings edit before the game sequence is
+# rebuilt and settings.json is written.
+SETTINGS_FLUSH_DELAY_MS = 200
+
+# Quiet period after the last preset edit before presets are written.
+PRESET_SAVE_DELAY_MS = 500
+
+# Penalty durations offered in the penalty dialog, in seconds; -1 means
+# the player is out for the rest of the match. "Rest of the match" is the
+# former wording, still accepted for existing saved data, while the UI
+# shows Total Dismissal.
+_PENALTY_DURATION_SECONDS = {
+    "1 minute": 60,
+    "2 minutes": 120,
+    "5 minutes": 300,
+    "Total Dismissal": -1,
+    "Rest of the match": -1,
+}
+
+# Fixed colours shared by every app instance.
+_THEME = types.SimpleNamespace(
+    referee_default_bg="red",
+    referee_default_fg="black",
+    referee_active_bg="black",
+    referee_active_fg="red",
+)
+
+
+def _now_seconds_of_day():
+    """Return the local wall-clock time as seconds since midnight."""
+    t = time.localtime()
+    return t.tm_hour * 3600 + t.tm_min * 60 + t.tm_sec
+
+
 def is_usb_dongle_connected():
     return hardware_detection.is_usb_dongle_connected(
         load_unified_settings,
         DEBUG_MODE
     )
 
+def _launch_file_manager_windows(folder_path):
+    # Windows: ShellExecute opens Explorer without spawning and
+    # tracking a child process of our own
+    os.startfile(os.path.normpath(folder_path))
+
+def _launch_file_manager_darwin(folder_path):
+    # macOS: Use open (don't check exit status)
+    subprocess.Popen(['open', folder_path], start_new_session=True)
+
+def _launch_file_manager_linux(folder_path):
+    # Linux and other Unix-like systems: Use xdg-open (don't check exit status)
+    subprocess.Popen(['xdg-open', folder_path], start_new_session=True)
+
+if _SYSTEM == 'Windows':
+    _launch_file_manager = _launch_file_manager_windows
+elif _SYSTEM == 'Darwin':
+    _launch_file_manager = _launch_file_manager_darwin
+else:
+    _launch_file_manager = _launch_file_manager_linux
+
 def open_folder_in_file_manager(folder_path):
     """
     Open a folder in the system's file manager.
     
     Cross-platform support:
-    - Windows: Uses explorer.exe
+    - Windows: Uses os.startfile (ShellExecute)
     - macOS: Uses open command
     - Linux: Uses xdg-open
     
     Args:
         folder_path: Absolute path to the folder to open
     """
-    import platform
-    
     if not os.path.exists(folder_path):
         messagebox.showerror("Error", f"Folder does not exist:\n{folder_path}")
         return
     
-    system = platform.system()
-    
     try:
-        if system == 'Windows':
-            # Windows: Use explorer with Popen (doesn't wait for exit status)
-            # Explorer.exe often returns non-zero exit codes even on success
-            subprocess.Popen(['explorer', os.path.normpath(folder_path)])
-        elif system == 'Darwin':
-            # macOS: Use open (don't check exit status)
-            subprocess.Popen(['open', folder_path])
-        else:
-            # Linux and other Unix-like systems: Use xdg-open (don't check exit status)
-            subprocess.Popen(['xdg-open', folder_path])
+        _launch_file_manager(folder_path)
     except FileNotFoundError:
-        messagebox.showerror("Error", f"File manager command not found on {system}")
+        messagebox.showerror("Error", f"File manager command not found on {_SYSTEM}")
     except OSError as e:
         messagebox.showerror("Error", f"Failed to open folder:\n{e}")
 
@@ -404,8 +473,6 @@ class GameManagementApp:
             return
 
         try:
-            import sound
-
             track = self.siren_var.get()
             volume = self.siren_volume.get()
 
@@ -436,23 +503,38 @@ class GameManagementApp:
         Safe Zigbee logger.
 
         It works during startup before the Zigbee tab and its log box
-        have been created, then writes to the on-screen log afterwards.
+        have been created, holding messages back until the tab is first
+        opened, then writes to the on-screen log afterwards.
         """
         print(f"Zigbee: {message}")
 
-        log_text = getattr(self, "log_text", None)
-
-        if log_text is None:
-            return
+        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
 
         def write_to_log():
+            log_text = getattr(self, "log_text", None)
+
+            # Until the Zigbee tab is first opened, keep the newest lines
+            # so they can be shown when it is built.
+            if log_text is None:
+                backlog = self._zigbee_log_backlog
+                backlog.append(f"[{timestamp}] {message}\n")
+                if len(backlog) > ZIGBEE_LOG_MAX_LINES:
+                    del backlog[0]
+                return
+
             try:
-                timestamp = datetime.datetime.now().strftime("%H:%M:%S")
                 log_text.config(state=tk.NORMAL)
                 log_text.insert(
                     tk.END,
                     f"[{timestamp}] {message}\n"
                 )
+                # Every entry ends in a newline, so the last line is empty.
+                entries = int(log_text.index("end-1c").split(".")[0]) - 1
+                if entries > ZIGBEE_LOG_MAX_LINES:
+                    log_text.delete(
+                        "1.0",
+                        f"{entries - ZIGBEE_LOG_MAX_LINES + 1}.0"
+                    )
                 log_text.see(tk.END)
                 log_text.config(state=tk.DISABLED)
 
@@ -472,63 +554,70 @@ class GameManagementApp:
         self.notebook.pack(expand=True, fill='both',)
 
         # --- Variable and font setup ---
+        # Each entry carries its initial "value" and "used" fields.
+        # Pure boolean options use the default for both; options with an
+        # entry hold the value as a string and start enabled.
         self.variables = {
-            "time_to_start_first_game": {"default": "", "checkbox": False, "unit": "HH:mm", "label": "Time to Start First Game:"},
-            "start_first_game_in": {"default": 1, "checkbox": False, "unit": "minutes", "label": "First Game Starts In:"},
-            "team_timeouts_allowed": {"default": True, "checkbox": True, "unit": "", "label": "Team time-outs allowed?"},
-            "team_timeout_period": {"default": 1, "checkbox": False, "unit": "minutes", "label": "Team Time-Out Period:"},
-            "half_period": {"default": 1, "checkbox": False, "unit": "minutes"},
-            "half_time_break": {"default": 1, "checkbox": False, "unit": "minutes"},
-            "overtime_allowed": {"default": True, "checkbox": True, "unit": "", "label": "Overtime allowed?"},
-            "overtime_game_break": {"default": 1, "checkbox": False, "unit": "minutes"},
-            "overtime_half_period": {"default": 1, "checkbox": False, "unit": "minutes"},
-            "overtime_half_time_break": {"default": 1, "checkbox": False, "unit": "minutes"},
-            "sudden_death_game_break": {"default": 1, "checkbox": True, "unit": "minutes"},
-            "between_game_break": {"default": 1, "checkbox": False, "unit": "minutes"},
-            "record_scorers_cap_number": {"default": False, "checkbox": True, "unit": "", "label": "Record Scorers Cap Number"},
-            "crib_time": {"default": 1, "checkbox": True, "unit": "seconds"}
+            "time_to_start_first_game": {"default": "", "checkbox": False, "unit": "HH:mm", "label": "Time to Start First Game:", "value": "", "used": True},
+            "start_first_game_in": {"default": 1, "checkbox": False, "unit": "minutes", "label": "First Game Starts In:", "value": "1", "used": True},
+            "team_timeouts_allowed": {"default": True, "checkbox": True, "unit": "", "label": "Team time-outs allowed?", "value": True, "used": True},
+            "team_timeout_period": {"default": 1, "checkbox": False, "unit": "minutes", "label": "Team Time-Out Period:", "value": "1", "used": True},
+            "half_period": {"default": 1, "checkbox": False, "unit": "minutes", "value": "1", "used": True},
+            "half_time_break": {"default": 1, "checkbox": False, "unit": "minutes", "value": "1", "used": True},
+            "overtime_allowed": {"default": True, "checkbox": True, "unit": "", "label": "Overtime allowed?", "value": True, "used": True},
+            "overtime_game_break": {"default": 1, "checkbox": False, "unit": "minutes", "value": "1", "used": True},
+            "overtime_half_period": {"default": 1, "checkbox": False, "unit": "minutes", "value": "1", "used": True},
+            "overtime_half_time_break": {"default": 1, "checkbox": False, "unit": "minutes", "value": "1", "used": True},
+            "sudden_death_game_break": {"default": 1, "checkbox": True, "unit": "minutes", "value": "1", "used": True},
+            "between_game_break": {"default": 1, "checkbox": False, "unit": "minutes", "value": "1", "used": True},
+            "record_scorers_cap_number": {"default": False, "checkbox": True, "unit": "", "label": "Record Scorers Cap Number", "value": False, "used": False},
+            "crib_time": {"default": 1, "checkbox": True, "unit": "seconds", "value": "1", "used": True}
         }
+        self._settings_entry_order = settings_ui.build_entry_order(self.variables)
 
-        # PATCH: Initialize 'value' and 'used' fields properly for all variables
-        for var_name, var_info in self.variables.items():
-            if var_info["checkbox"]:
-                # Variables with checkboxes: separate 'value' and 'used' fields
-                if var_name in ["team_timeouts_allowed", "overtime_allowed", "record_scorers_cap_number"]:
-                    # Pure boolean variables (no numeric component)
-                    self.variables[var_name]["value"] = var_info["default"]  # True or False
-                    self.variables[var_name]["used"] = var_info["default"]   # True or False
-                else:
-                    # Mixed variables (checkbox + entry): numeric value, boolean used
-                    self.variables[var_name]["value"] = str(var_info["default"])  # "1" 
-                    self.variables[var_name]["used"] = True  # enabled by default
-            else:
-                # Variables without checkboxes: only 'value' field, always used
-                self.variables[var_name]["value"] = str(var_info["default"])
-                self.variables[var_name]["used"] = True
-
-        self.fonts = {
-            "court_time": font.Font(family="Arial", size=36),
-            "half": font.Font(family="Arial", size=36, weight="bold"),
-            "team": font.Font(family="Arial", size=30, weight="bold"),
-            "score": font.Font(family="Arial", size=200, weight="bold"),
-            "timer": font.Font(family="Arial", size=110, weight="bold"),
-            "game_no": font.Font(family="Arial", size=20),
-            "button": font.Font(family="Arial", size=20, weight="bold"),
-            "timeout_button": font.Font(family="Arial", size=20, weight="bold"),
-            "referee_timeout_timer": font.Font(family="Arial", size=20, weight="bold"),
-        }
-
-        self.display_fonts = {
-            "court_time": font.Font(family="Arial", size=36),
-            "half": font.Font(family="Arial", size=36, weight="bold"),
-            "team": font.Font(family="Arial", size=30, weight="bold"),
-            "score": font.Font(family="Arial", size=200, weight="bold"),
-            "timer": font.Font(family="Arial", size=110, weight="bold"),
-            "game_no": font.Font(family="Arial", size=20),
-            "referee_timeout_timer": font.Font(family="Arial", size=24),
-        }
+        # Fonts are created on first use; see ui_scaling.LazyFonts.
+        self.fonts = ui_scaling.LazyFonts(ui_scaling.FONT_SPECS)
+        self.display_fonts = ui_scaling.LazyFonts(ui_scaling.DISPLAY_FONT_SPECS)
+        self.zigbee_fonts = ui_scaling.LazyFonts(ui_scaling.ZIGBEE_FONT_SPECS)
 
         self.engine = GameEngine()
+        self._minutes_cache = {}
+        self._cached_top3 = ([], [])
+        self._cached_label_texts = (("", "", ""), ("", "", ""))
+        self._cached_label_sig = None
+        # Last grid placement per widget path (None when grid_removed),
+        # so the per-tick layout code only calls into Tk on a change.
+        self._grid_state = {}
+        # Settings rows by variable name and the overtime rows greyed out
+        # with the Overtime checkbox (both filled by create_settings_tab),
+        # and the last accepted numeric value of each entry.
+        self._widget_by_name = {}
+        self._overtime_widgets = []
+        self._validated_numeric = {}
+        # Set while a game-number / team-name refresh is queued with
+        # after_idle, so bursts of requests run the refresh only once.
+        self._game_number_refresh_pending = False
+        self._team_names_refresh_pending = False
+        # Pending after() id for the coalesced rebuild+save that follows a
+        # settings edit, and whether that flush must rebuild the sequence.
+        self._settings_flush_id = None
+        self._settings_flush_rebuild = False
+        # Clock reading shared by load_settings and build_game_sequence when
+        # they run together, so both derive the start time from one "now".
+        self._settings_now = None
+        # Pending after() id for the coalesced presets write.
+        self._preset_save_id = None
+        # Zigbee log lines written before the Zigbee tab is first built.
+        self._zigbee_log_backlog = []
+        # Preset button press-and-hold state (see preset_manager).
+        self._button_hold_timer = None
+        self._button_hold_start_time = None
+        self._button_hold_index = None
+        self._button_hold_widget = None
+        # Preset editing dialog, built on first long-press and then reused.
+        self._preset_dialog = None
+        # Pending after() job that clears the preset error label.
+        self._preset_error_clear_id = None
         
         # Event-driven Tkinter variables for all display widgets
         self.white_score_var = tk.IntVar(value=0)
@@ -540,11 +629,21 @@ class GameManagementApp:
         self.white_team_var = tk.StringVar(value="White")
         self.black_team_var = tk.StringVar(value="Black")
         self.referee_timeout_timer_var = tk.StringVar(value="Ref Time-Out")
+        # Last text written to timer_var / court_time_var (their only
+        # writers are update_timer_display and _show_court_time).
+        self._timer_text = "00:00"
+        self._court_time_text = "Court Time is 00:00:00"
         
         # Tournament List tracking
         self.current_game_index = 0  # Index in self.game_numbers list
         self.all_game_numbers = []
         self.game_numbers = []
+        self._game_num_to_idx = {}
+        # Selected tournament CSV filename, or None; kept in sync with
+        # csv_var by a trace once the settings tab creates it.
+        self._current_csv_file = None
+        # (csv file, game) whose team names are currently shown.
+        self._last_team_names_key = None
         self.court_game_mode_var = tk.StringVar(value="consecutive")
         
         self.engine.start_timer()
@@ -554,6 +653,10 @@ class GameManagementApp:
         self.court_time_seconds = None  # Will be synchronized to local time at startup/reset
         self.court_time_job = None
         self.court_time_paused = False
+        # Monotonic time court time was last advanced to, and the part of a
+        # second accrued since, so ticks count real time rather than calls.
+        self._court_time_mark = time.monotonic()
+        self._court_time_fraction = 0.0
 
         self.timer_job = None
         self.reset_timer_button = None
@@ -601,13 +704,22 @@ class GameManagementApp:
         self.display_test_windows = []
         self.referee_timeout_active = False
         self.referee_timeout_elapsed = 0
-        self.referee_timeout_default_bg = "red"
-        self.referee_timeout_default_fg = "black"
-        self.referee_timeout_active_bg = "black"
-        self.referee_timeout_active_fg = "red"
+        self._ref_on_cfg = {
+            "bg": _THEME.referee_active_bg,
+            "fg": _THEME.referee_active_fg,
+            "activebackground": _THEME.referee_active_bg,
+            "activeforeground": _THEME.referee_active_fg,
+        }
+        self._ref_off_cfg = {
+            "bg": _THEME.referee_default_bg,
+            "fg": _THEME.referee_default_fg,
+            "activebackground": _THEME.referee_default_bg,
+            "activeforeground": _THEME.referee_default_fg,
+        }
         
         # Penalty timer system
         self.penalty_timers_paused = False
+        self.penalty_window = None
         self.penalty_timer_jobs = []
         
         # Store last position of penalties dialog (None means use default positioning)
@@ -623,8 +735,7 @@ class GameManagementApp:
         self.siren_duration = tk.DoubleVar(value=sound_settings.get("siren_duration", 1.5))
         
         # Initialize sound selection variables with auto-selection of first audio file if no saved setting
-        sound_files = get_sound_files()
-        available_audio_files = sound_files if sound_files != ["No sound files found"] else []
+        available_audio_files = get_available_sound_files()
         
         pips_default = sound_settings.get("pips_sound", "Default")
         siren_default = sound_settings.get("siren_sound", "Default")
@@ -796,7 +907,6 @@ class GameManagementApp:
             print("Starting hardware auto-detection...")
 
             try:
-                import serial_siren_listener
                 ports = serial_siren_listener.get_detected_ports()
                 arduino_com = ports.get("arduino_port")
                 zigbee_com = ports.get("zigbee_port")
@@ -848,8 +958,8 @@ class GameManagementApp:
         self.create_sounds_tab()
         splash_report("Sounds tab created", True)
 
-        self.create_zigbee_siren_tab()
-        splash_report("Siren control tab created", True)
+        self.add_zigbee_siren_tab()
+        splash_report("Siren control tab added", True)
 
         # NOW start Zigbee AFTER all widgets exist
         print("STARTUP: Initializing Zigbee connection (MQTT stability verified)")
@@ -884,7 +994,8 @@ class GameManagementApp:
         self.build_game_sequence()
         splash_report("Game sequence built", True)
 
-        self.master.bind('<Configure>', self.scale_fonts)
+        self._scale_pending = None
+        self.master.bind('<Configure>', self._schedule_scale)
         self.initial_width = self.master.winfo_width()
         self.master.update_idletasks()
         self.scale_fonts(None)
@@ -894,16 +1005,24 @@ class GameManagementApp:
         self.apply_screen_configuration()
         splash_report("Screen configuration applied", True)
 
-        self.start_penalty_display_updates()
-        self.sync_penalty_display_to_external()
-        splash_report("Penalty display synchronization started", True)
+        # Lay out the penalty areas once now; the 1 Hz master tick only
+        # start the first time the Scoreboard tab is shown, since
+        # penalties can only be added from there.
+        self.update_penalty_display()
+        self._penalty_display_ready = False
+        self._tick_id = None
+        self.notebook.bind(
+            '<<NotebookTabChanged>>',
+            self._on_notebook_tab_changed,
+            add='+'
+        )
+        splash_report("Penalty display synchronization deferred", True)
 
         self.reset_timer()
         splash_report("Timer initialized", True)
 
         # 4. FINAL APPLICATION HARDWARE INITIALIZATION HOOK
         try:
-            import serial_siren_listener
             serial_siren_listener.start_serial_listener(self)
             splash_report("Serial siren listener started", True)
             if DEBUG_MODE:
@@ -939,7 +1058,7 @@ class GameManagementApp:
         
     def write_game_results_to_csv(self, game_number, white_score, black_score, penalties):
         return csv_export.write_game_results_to_csv(
-            csv_file=self.csv_var.get(),
+            csv_file=self._current_csv_file,
             base_dir=BASE_DIR,
             game_number=game_number,
             white_score=white_score,
@@ -976,39 +1095,17 @@ class GameManagementApp:
             The presentation label supplies its 12-column position.
             """
             try:
-                grid_info = label.grid_info()
-
-                current_row = int(
-                    grid_info.get("row", -1)
-                )
-                current_column = int(
-                    grid_info.get("column", -1)
-                )
-                current_columnspan = int(
-                    grid_info.get("columnspan", 1)
+                self._grid_if_changed(
+                    label,
+                    row=row,
+                    column=column,
+                    columnspan=columnspan,
+                    padx=1,
+                    pady=1,
+                    sticky="nsew"
                 )
 
-                if (
-                    not label.winfo_ismapped()
-                    or current_row != row
-                    or current_column != column
-                    or current_columnspan != columnspan
-                ):
-                    label.grid(
-                        row=row,
-                        column=column,
-                        columnspan=columnspan,
-                        padx=1,
-                        pady=1,
-                        sticky="nsew"
-                    )
-
-            except (
-                AttributeError,
-                tk.TclError,
-                TypeError,
-                ValueError
-            ):
+            except (AttributeError, tk.TclError):
                 pass
 
         def place_penalty_grid(grid_frame, area_frame_name):
@@ -1016,7 +1113,8 @@ class GameManagementApp:
             area_frame = getattr(self, area_frame_name, None)
 
             if area_frame is not None:
-                grid_frame.grid(
+                self._grid_if_changed(
+                    grid_frame,
                     row=0,
                     column=0,
                     padx=0,
@@ -1024,7 +1122,8 @@ class GameManagementApp:
                     sticky="nsew"
                 )
             else:
-                grid_frame.grid(
+                self._grid_if_changed(
+                    grid_frame,
                     row=2,
                     column=3,
                     columnspan=3,
@@ -1085,14 +1184,14 @@ class GameManagementApp:
                 bg=between_game_colour,
                 fg="black"
             )
-            banner.grid(**grid_options)
+            self._grid_if_changed(banner, **grid_options)
 
         def hide_next_game_banner(banner_attribute):
             banner = getattr(self, banner_attribute, None)
 
             try:
-                if banner is not None and banner.winfo_exists():
-                    banner.grid_remove()
+                if banner is not None:
+                    self._grid_remove_if_shown(banner)
             except (AttributeError, tk.TclError):
                 pass
 
@@ -1107,7 +1206,7 @@ class GameManagementApp:
 
         try:
             if show_next_game:
-                self.penalty_grid_frame.grid_remove()
+                self._grid_remove_if_shown(self.penalty_grid_frame)
 
                 show_next_game_banner(
                     "next_game_banner",
@@ -1127,7 +1226,7 @@ class GameManagementApp:
                     self.update_penalty_grid()
 
                 else:
-                    self.penalty_grid_frame.grid_remove()
+                    self._grid_remove_if_shown(self.penalty_grid_frame)
 
             place_game_label(self.game_label)
             self.update_game_number_display()
@@ -1142,7 +1241,7 @@ class GameManagementApp:
             )
 
             if show_next_game:
-                self.display_penalty_grid_frame.grid_remove()
+                self._grid_remove_if_shown(self.display_penalty_grid_frame)
 
                 show_next_game_banner(
                     "display_next_game_banner",
@@ -1162,7 +1261,7 @@ class GameManagementApp:
                     self.update_display_penalty_grid()
 
                 else:
-                    self.display_penalty_grid_frame.grid_remove()
+                    self._grid_remove_if_shown(self.display_penalty_grid_frame)
 
             place_game_label(
                 self.display_game_label,
@@ -1174,65 +1273,118 @@ class GameManagementApp:
         except (AttributeError, tk.TclError):
             pass
 
-    def _penalty_sort_key(self, p):
-        return display_manager.penalty_sort_key(p)
+    def _compute_top3(self):
+        """
+        Return the three most urgent (white, black) penalties.
+
+        The result is cached until active_penalties changes, so the
+        operator and display grids share one computation per tick.
+        """
+        if not self.engine.penalties_dirty:
+            return self._cached_top3
+
+        white_penalties = []
+        black_penalties = []
+
+        for p in self.engine.active_penalties:
+            if p["team"] == "White":
+                white_penalties.append(p)
+            elif p["team"] == "Black":
+                black_penalties.append(p)
+
+        self._cached_top3 = (
+            heapq.nsmallest(3, white_penalties, key=display_manager.penalty_sort_key),
+            heapq.nsmallest(3, black_penalties, key=display_manager.penalty_sort_key),
+        )
+        self.engine.penalties_dirty = False
+
+        return self._cached_top3
+
+    def _format_penalty_labels(self):
+        """Return the (white, black) grid texts as two 3-tuples of strings."""
+        top3 = self._compute_top3()
+
+        # Only the cap and remaining time are visible, so the texts are
+        # reformatted only when that signature changes.
+        sig = tuple(
+            tuple(
+                (p["cap"], p["seconds_remaining"], p["is_rest_of_match"])
+                for p in team_penalties
+            )
+            for team_penalties in top3
+        )
+
+        if sig != self._cached_label_sig:
+            white_penalties, black_penalties = top3
+            self._cached_label_texts = tuple(
+                tuple(
+                    display_manager.format_penalty_label(team_penalties[i])
+                    if i < len(team_penalties)
+                    else ""
+                    for i in range(3)
+                )
+                for team_penalties in (white_penalties, black_penalties)
+            )
+            self._cached_label_sig = sig
+
+        return self._cached_label_texts
+
+    def _update_grid(self, grid):
+        """
+        Write the current penalty texts into one grid's cell StringVars.
+
+        grid is the state dict built by create_penalty_grid_widget. Its
+        last_texts mirror what each StringVar holds, so unchanged cells
+        are skipped without any Tcl round-trip, and the whole update is
+        skipped when the texts tuple is the one last applied.
+        """
+        texts = self._format_penalty_labels()
+
+        if texts is grid["applied"]:
+            return
+
+        stringvars = grid["stringvars"]
+        last_texts = grid["last_texts"]
+
+        for col, team_texts in enumerate(texts):
+            for i, label_text in enumerate(team_texts):
+                if last_texts[i][col] != label_text:
+                    stringvars[i][col].set(label_text)
+                    last_texts[i][col] = label_text
+
+        grid["applied"] = texts
 
     def update_penalty_grid(self):
-        white_penalties = sorted(
-            [p for p in self.engine.active_penalties if p["team"] == "White"],
-            key=self._penalty_sort_key
-        )[:3]
-        black_penalties = sorted(
-            [p for p in self.engine.active_penalties if p["team"] == "Black"],
-            key=self._penalty_sort_key
-        )[:3]
-        for i in range(3):
-            if i < len(white_penalties):
-                p = white_penalties[i]
-                label_text = display_manager.format_penalty_label(p)
-            else:
-                label_text = ""
-            if self.penalty_labels[i][0].cget('text') != label_text:
-                self.penalty_labels[i][0].config(text=label_text)
-            if i < len(black_penalties):
-                p = black_penalties[i]
-                label_text = display_manager.format_penalty_label(p)
-            else:
-                label_text = ""
-            if self.penalty_labels[i][1].cget('text') != label_text:
-                self.penalty_labels[i][1].config(text=label_text)
+        self._update_grid(self._penalty_grid)
 
     def update_display_penalty_grid(self):
-        white_penalties = sorted(
-            [p for p in self.engine.active_penalties if p["team"] == "White"],
-            key=self._penalty_sort_key
-        )[:3]
-        black_penalties = sorted(
-            [p for p in self.engine.active_penalties if p["team"] == "Black"],
-            key=self._penalty_sort_key
-        )[:3]
-        for i in range(3):
-            if i < len(white_penalties):
-                p = white_penalties[i]
-                label_text = display_manager.format_penalty_label(p)
-            else:
-                label_text = ""
-            if self.display_penalty_labels[i][0].cget('text') != label_text:
-                self.display_penalty_labels[i][0].config(text=label_text)
-            if i < len(black_penalties):
-                p = black_penalties[i]
-                label_text = display_manager.format_penalty_label(p)
-            else:
-                label_text = ""
-            if self.display_penalty_labels[i][1].cget('text') != label_text:
-                self.display_penalty_labels[i][1].config(text=label_text)
+        self._update_grid(self._display_penalty_grid)
 
-    def start_penalty_display_updates(self):
-        self.update_penalty_display()
-        self.master.after(1000, self.start_penalty_display_updates)
+    def _on_notebook_tab_changed(self, event=None):
+        try:
+            if self.notebook.index('current') == 0:
+                self._ensure_penalty_display_ready()
+            elif self.notebook.select() == str(self.zigbee_tab):
+                zigbee_ui.ensure_zigbee_siren_tab(self)
+        except tk.TclError:
+            pass
+
+    def _ensure_penalty_display_ready(self):
+        if self._penalty_display_ready:
+            return
 
-    def sync_penalty_display_to_external(self):
-        return display_manager.sync_penalty_display_to_external(self)
+        self._penalty_display_ready = True
+        self._master_tick()
+
+    def _master_tick(self):
+        """
+        Run the once-a-second display jobs from a single after() timer.
+
+        Add any further 1 Hz work here rather than starting another
+        self-rescheduling loop, so the mainloop only wakes once per second.
+        """
+        self.update_penalty_display()
+        self._tick_id = self.master.after(1000, self._master_tick)
 
     def create_penalty_grid_widget(self, parent, is_display=False):
         # Add internal padding for slightly smaller appearance than the game label
@@ -1242,17 +1394,32 @@ class GameManagementApp:
         for row in range(3):
             frame.grid_rowconfigure(row, weight=1)
         labels = [[None for _ in range(2)] for _ in range(3)]
+        stringvars = [[tk.StringVar(value="") for _ in range(2)] for _ in range(3)]
         for row in range(3):
-            lbl_white = tk.Label(frame, text="", font=("Arial", 9), width=8,
+            lbl_white = tk.Label(frame, textvariable=stringvars[row][0], font=("Arial", 9), width=8,
                                  anchor="center", relief="ridge", fg="black", bg="white", justify="center")
             lbl_white.grid(row=row, column=0, padx=1, pady=1, sticky="nsew")
             labels[row][0] = lbl_white
-            lbl_black = tk.Label(frame, text="", font=("Arial", 9), width=8,
+            lbl_black = tk.Label(frame, textvariable=stringvars[row][1], font=("Arial", 9), width=8,
                                  anchor="center", relief="ridge", fg="white", bg="black", justify="center")
             lbl_black.grid(row=row, column=1, padx=1, pady=1, sticky="nsew")
             labels[row][1] = lbl_black
+        # Event-driven: the grid updaters set these StringVars, tracking
+        # the last text per cell in Python rather than calling cget().
+        grid = {
+            "stringvars": stringvars,
+            "last_texts": [["" for _ in range(2)] for _ in range(3)],
+            "applied": None,
+        }
+        if is_display:
+            self._display_penalty_grid = grid
+        else:
+            self._penalty_grid = grid
         return frame, labels
 
+    def _schedule_scale(self, event=None):
+        return ui_scaling.schedule_scale_fonts(self, event)
+
     def scale_fonts(self, event=None):
         return ui_scaling.scale_fonts(self, event)
 
@@ -1260,32 +1427,39 @@ class GameManagementApp:
         return ui_scaling.scale_display_fonts(self, event)
 
     def get_minutes(self, varname):
-        try:
-            val = self.variables[varname].get("value", self.variables[varname]["default"])
-            # PATCH: Handle boolean values by falling back to default
-            if isinstance(val, bool):
-                val = self.variables[varname]["default"]
-            val = str(val).replace(',', '.')
-            return float(val) * 60
-        except Exception:
-            val = str(self.variables[varname]["default"]).replace(',', '.')
-            return float(val) * 60
+        var_info = self.variables[varname]
+        val = var_info.get("value", var_info["default"])
+        # PATCH: Handle boolean values by falling back to default
+        if isinstance(val, bool):
+            val = var_info["default"]
+
+        key = (varname, val)
+        cached = self._minutes_cache.get(key)
+        if cached is not None:
+            return cached
+
+        number = game_settings_manager.parse_float_comma(val)
+        if number is None:
+            number = game_settings_manager.to_float_comma(var_info["default"])
+        seconds = number * 60
+
+        self._minutes_cache[key] = seconds
+        return seconds
+
+    def _invalidate_minutes_cache(self, varname):
+        for key in [key for key in self._minutes_cache if key[0] == varname]:
+            del self._minutes_cache[key]
 
     def build_game_sequence(self):
         seq = []
         # Always start with "First Game Starts In:" period
-        now = datetime.datetime.now()
         time_val = self.variables.get("time_to_start_first_game", {}).get("value", "")
         game_starts_in_seconds = None
         if time_val:
-            match = re.fullmatch(r"(?:[0-9]|1[0-9]|2[0-3]):[0-5][0-9]", time_val.strip())
+            match = settings_ui.HHMM_RE.fullmatch(time_val.strip())
             if match:
                 hh, mm = map(int, time_val.strip().split(":"))
-                target = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
-                if target < now:
-                    target = target + datetime.timedelta(days=1)
-                delta = target - now
-                seconds_to_start = int(delta.total_seconds())
+                seconds_to_start = int(self._seconds_until(hh, mm))
                 # Use the time directly without subtracting Between Game Break
                 game_starts_in_seconds = max(0, seconds_to_start)
         # First period: "First Game Starts In:" - only runs once at app start
@@ -1325,6 +1499,18 @@ class GameManagementApp:
     def refresh_csv_dropdown(self):
         return csv_ui.refresh_csv_dropdown(self)
         
+    def _on_csv_var_changed(self, *args):
+        """Keep _current_csv_file in step with the tournament dropdown."""
+        csv_file = self.csv_var.get()
+
+        # Any (re)selection reloads the names, even for the same file.
+        self._last_team_names_key = None
+        self._current_csv_file = (
+            csv_file
+            if csv_file and csv_file != "No CSV files found"
+            else None
+        )
+
     def parse_csv_game_numbers(self, csv_filename):
         return csv_helpers.parse_csv_game_numbers(
             csv_filename,
@@ -1377,7 +1563,20 @@ class GameManagementApp:
         return game_flow.get_current_game_number(self)
 
     def update_game_number_display(self):
+        """
+        Schedule a game-number refresh for the next idle moment.
+
+        Game advances, selection traces and the 1 Hz penalty tick can all
+        ask for a refresh within one event; they collapse into one update.
+        """
+        if not self._game_number_refresh_pending:
+            self._game_number_refresh_pending = True
+            self.master.after_idle(self._refresh_game_number_display)
+
+    def _refresh_game_number_display(self):
         """Update the visible game number, including next-game preview."""
+        self._game_number_refresh_pending = False
+
         if (
             getattr(self, "next_game_preview_active", False)
             and getattr(self, "next_game_preview_number", None)
@@ -1428,7 +1627,15 @@ class GameManagementApp:
         self.update_team_names_display()
 
     def update_team_names_display(self):
+        """Schedule a team-name refresh; repeated requests share one CSV lookup."""
+        if not self._team_names_refresh_pending:
+            self._team_names_refresh_pending = True
+            self.master.after_idle(self._refresh_team_names_display)
+
+    def _refresh_team_names_display(self):
         """Update team names from the selected tournament game."""
+        self._team_names_refresh_pending = False
+
         try:
             use_tournament_list = True
 
@@ -1451,6 +1658,7 @@ class GameManagementApp:
                     )
 
                 self.toggle_display_team_names()
+                self._last_team_names_key = None
                 return
 
             current_game = (
@@ -1462,21 +1670,21 @@ class GameManagementApp:
                 else self.get_current_game_number()
             )
 
+            # The names on screen already belong to this file and game.
+            team_names_key = (self._current_csv_file, current_game)
+
+            if team_names_key == self._last_team_names_key:
+                return
+
             # After the final tournament game, deliberately show no teams.
             if not current_game:
                 white_team = ""
                 black_team = ""
 
             else:
-                csv_file = (
-                    self.csv_var.get()
-                    if hasattr(self, "csv_var")
-                    else None
-                )
-
                 white_team, black_team = (
                     self.parse_csv_team_names(
-                        csv_file,
+                        self._current_csv_file,
                         current_game
                     )
                 )
@@ -1492,8 +1700,10 @@ class GameManagementApp:
                 )
 
             self.toggle_display_team_names()
+            self._last_team_names_key = team_names_key
 
         except Exception as error:
+            self._last_team_names_key = None
             print(
                 f"Error updating team names display: "
                 f"{error}"
@@ -1526,6 +1736,9 @@ class GameManagementApp:
     def create_sounds_tab(self):
         return sounds_ui.create_sounds_tab(self)
         
+    def add_zigbee_siren_tab(self):
+        return zigbee_ui.add_zigbee_siren_tab(self)
+
     def create_zigbee_siren_tab(self):
         return zigbee_ui.create_zigbee_siren_tab(self)
    
@@ -1551,11 +1764,12 @@ class GameManagementApp:
         except Exception as e:
             self.add_to_zigbee_log(f"App siren test failed: {e}")
 
-    def _make_press_handler(self, idx):
-        return lambda event: self._start_button_hold(event, idx)
+    def _on_preset_press(self, event):
+        # Shared by all preset buttons; each carries its own _preset_index.
+        return self._start_button_hold(event, event.widget._preset_index)
 
-    def _make_release_handler(self, idx):
-        return lambda event: self._button_release(event, idx)
+    def _on_preset_release(self, event):
+        return self._button_release(event, event.widget._preset_index)
 
     def set_widget2_button_text(self, idx, new_text):
         return preset_manager.set_widget2_button_text(
@@ -1565,7 +1779,23 @@ class GameManagementApp:
         )
 
     def save_preset_settings(self):
-        return save_preset_settings(self.button_data)
+        """Queue a write of the preset data; a burst of edits is written once."""
+        if self._preset_save_id is not None:
+            self.master.after_cancel(self._preset_save_id)
+        self._preset_save_id = self.master.after(
+            PRESET_SAVE_DELAY_MS, self._flush_preset_save
+        )
+
+    def _flush_preset_save(self):
+        """Write the queued preset data now, if a write is pending."""
+        if self._preset_save_id is None:
+            return
+        self.master.after_cancel(self._preset_save_id)
+        self._preset_save_id = None
+        try:
+            save_preset_settings(self.button_data)
+        except Exception as e:
+            print(f"Error saving preset settings: {e}")
 
     def load_preset_settings(self):
         return settings_manager.load_preset_settings(BASE_DIR)
@@ -1599,37 +1829,37 @@ class GameManagementApp:
 
     def _on_settings_variable_change(self, *args):
         self.load_settings()
-        self.build_game_sequence()
-        # Save game settings when variables change
-        self.save_game_settings()
+        # Rebuild and save once the burst of changes settles
+        self._schedule_settings_flush()
     
     def _on_single_variable_change(self, var_name):
         """Handle change to a single variable without updating all widgets."""
+        self._invalidate_minutes_cache(var_name)
+
         # Only update the specific variable in self.variables
-        for widget in self.widgets:
-            if widget["name"] == var_name:
-                entry = widget["entry"]
-                var_info = self.variables[var_name]
-                
-                # Update the specific variable
-                if entry is not None and widget["checkbox"] is not None:
-                    # Variable with both checkbox and entry
-                    value = entry.get().replace(',', '.')
-                    try:
-                        float(value)
-                        self.variables[var_name]["value"] = value
-                    except ValueError:
-                        self.variables[var_name]["value"] = str(var_info["default"])
-                    self.variables[var_name]["used"] = widget["checkbox"].get()
-                elif entry is not None:
-                    # Entry-only variable
-                    value = entry.get().replace(',', '.')
-                    self.variables[var_name]["value"] = value
-                    self.variables[var_name]["used"] = True
-                elif widget["checkbox"] is not None:
-                    # Checkbox-only variable
-                    self.variables[var_name]["used"] = widget["checkbox"].get()
-                break
+        widget = self._widget_by_name.get(var_name)
+        if widget is not None:
+            entry = widget["entry"]
+            var_info = self.variables[var_name]
+            
+            # Update the specific variable
+            if entry is not None and widget["checkbox"] is not None:
+                # Variable with both checkbox and entry
+                value = entry.get().replace(',', '.')
+                if self._remember_numeric(var_name, value):
+                    var_info["value"] = value
+                else:
+                    var_info["value"] = str(var_info["default"])
+                var_info["used"] = widget["checkbox"].get()
+            elif entry is not None:
+                # Entry-only variable
+                value = entry.get().replace(',', '.')
+                self._remember_numeric(var_name, value)
+                var_info["value"] = value
+                var_info["used"] = True
+            elif widget["checkbox"] is not None:
+                # Checkbox-only variable
+                var_info["used"] = widget["checkbox"].get()
         
         # Synchronize the two time fields unidirectionally
         if var_name == "time_to_start_first_game":
@@ -1639,50 +1869,90 @@ class GameManagementApp:
             # Clear time_to_start_first_game when start_first_game_in changes
             # to ensure build_game_sequence uses start_first_game_in directly
             self.variables["time_to_start_first_game"]["value"] = ""
-            for widget in self.widgets:
-                if widget["name"] == "time_to_start_first_game":
-                    widget["entry"].delete(0, tk.END)
-                    break
+            widget = self._widget_by_name.get("time_to_start_first_game")
+            if widget is not None:
+                widget["var"].set("")
         
-        # Only rebuild game sequence if the variable affects the sequence structure
-        # Variables that don't affect game sequence: record_scorers_cap_number, team_timeouts_allowed, crib_time
-        if var_name not in ["record_scorers_cap_number", "team_timeouts_allowed", "crib_time"]:
+        # Only rebuild game sequence if the variable affects the sequence
+        # structure, but always save settings; both are coalesced so a
+        # burst of edits (e.g. applying a preset) runs them once.
+        self._schedule_settings_flush(
+            rebuild=var_name in _SEQUENCE_VARIABLES
+        )
+
+    def _schedule_settings_flush(self, rebuild=True):
+        """Queue the game-sequence rebuild and settings save after edits settle."""
+        self._settings_flush_rebuild = self._settings_flush_rebuild or rebuild
+        if self._settings_flush_id is not None:
+            self.master.after_cancel(self._settings_flush_id)
+        self._settings_flush_id = self.master.after(
+            SETTINGS_FLUSH_DELAY_MS, self._flush_settings
+        )
+
+    def _flush_settings(self):
+        """Run the queued rebuild and save now, if one is pending."""
+        if self._settings_flush_id is None:
+            return
+        self.master.after_cancel(self._settings_flush_id)
+        self._settings_flush_id = None
+        if self._settings_flush_rebuild:
+            self._settings_flush_rebuild = False
             self.build_game_sequence()
-        
-        # Always save settings when a variable changes
         self.save_game_settings()
     
+    def _remember_numeric(self, var_name, value):
+        """Record value as var_name's last valid number; return whether it parsed."""
+        number = game_settings_manager.parse_float_comma(value)
+        if number is None:
+            self._validated_numeric.pop(var_name, None)
+            return False
+        self._validated_numeric[var_name] = number
+        return True
+
+    def _compute_minutes_to_start(self, time_str):
+        """Return whole minutes until HH:MM (tomorrow if already passed), or None."""
+        if not time_str:
+            return None
+        if not _STRICT_HHMM_RE.fullmatch(time_str):
+            return None
+        hh, mm = map(int, time_str.split(":"))
+        return int(self._seconds_until(hh, mm) // 60)
+
+    def _seconds_until(self, hh, mm):
+        """Seconds from now until hh:mm, tomorrow if it has already passed today."""
+        now = self._settings_now or datetime.datetime.now()
+        target = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
+        if target < now:
+            target = target + datetime.timedelta(days=1)
+        return (target - now).total_seconds()
+
+    def _load_settings_and_build_sequence(self):
+        """Reload settings and rebuild the sequence against one clock reading."""
+        self._settings_now = datetime.datetime.now()
+        try:
+            self.load_settings()
+            self.build_game_sequence()
+        finally:
+            self._settings_now = None
+
     def _update_start_first_game_in(self):
         """Update only the start_first_game_in calculated field."""
         time_entry_val = None
         start_first_game_in_widget = None
         
-        for widget in self.widgets:
-            if widget["name"] == "time_to_start_first_game":
-                time_entry_val = widget["entry"].get().strip()
-            elif widget["name"] == "start_first_game_in":
-                start_first_game_in_widget = widget["entry"]
+        widget = self._widget_by_name.get("time_to_start_first_game")
+        if widget is not None:
+            time_entry_val = widget["entry"].get().strip()
+        widget = self._widget_by_name.get("start_first_game_in")
+        if widget is not None:
+            start_first_game_in_widget = widget["var"]
         
         # Calculate start_first_game_in value if time is valid
-        minutes_to_start = None
-        now = datetime.datetime.now()
-        if time_entry_val:
-            try:
-                time_match = re.match(r"^([01][0-9]|2[0-3]):[0-5][0-9]$", time_entry_val)
-                if time_match:
-                    hh, mm = map(int, time_entry_val.split(":"))
-                    target = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
-                    if target < now:
-                        target = target + datetime.timedelta(days=1)
-                    delta = target - now
-                    minutes_to_start = int(delta.total_seconds() // 60)
-            except Exception:
-                minutes_to_start = None
+        minutes_to_start = self._compute_minutes_to_start(time_entry_val)
         
         if minutes_to_start is not None and start_first_game_in_widget is not None:
             value = max(0, minutes_to_start)
-            start_first_game_in_widget.delete(0, tk.END)
-            start_first_game_in_widget.insert(0, str(value))
+            start_first_game_in_widget.set(str(value))
             self.variables["start_first_game_in"]["value"] = str(value)
     
     def _update_time_to_start_first_game(self):
@@ -1690,11 +1960,12 @@ class GameManagementApp:
         start_first_game_in_val = None
         time_widget = None
         
-        for widget in self.widgets:
-            if widget["name"] == "start_first_game_in":
-                start_first_game_in_val = widget["entry"].get().strip()
-            elif widget["name"] == "time_to_start_first_game":
-                time_widget = widget["entry"]
+        widget = self._widget_by_name.get("start_first_game_in")
+        if widget is not None:
+            start_first_game_in_val = widget["entry"].get().strip()
+        widget = self._widget_by_name.get("time_to_start_first_game")
+        if widget is not None:
+            time_widget = widget["var"]
         
         # Calculate time_to_start_first_game if start_first_game_in is valid
         if start_first_game_in_val and time_widget is not None:
@@ -1710,44 +1981,14 @@ class GameManagementApp:
                 time_str = f"{target.hour:02d}:{target.minute:02d}"
                 
                 # Update the widget
-                time_widget.delete(0, tk.END)
-                time_widget.insert(0, time_str)
+                time_widget.set(time_str)
                 self.variables["time_to_start_first_game"]["value"] = time_str
             except Exception:
                 pass  # If parsing fails, don't update
 
     def load_settings(self):
         # Calculate "Start First Game In" from "Time to Start First Game"
-        time_entry_val = None
-        start_first_game_in_widget = None
-        for widget in self.widgets:
-            if widget["name"] == "time_to_start_first_game":
-                time_entry_val = widget["entry"].get().strip()
-            elif widget["name"] == "start_first_game_in":
-                start_first_game_in_widget = widget["entry"]
-        # Calculate start_first_game_in value if time is valid
-        minutes_to_start = None
-        now = datetime.datetime.now()
-        if time_entry_val:
-            try:
-                # Allow single or double digit hour, always two digit minute
-                # Use strict 24-hour regex
-                time_match = re.match(r"^([01][0-9]|2[0-3]):[0-5][0-9]$", time_entry_val)
-                if time_match:
-                    hh, mm = map(int, time_entry_val.split(":"))
-                    target = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
-                    # If target time already passed today, assume it's tomorrow
-                    if target < now:
-                        target = target + datetime.timedelta(days=1)
-                    delta = target - now
-                    minutes_to_start = int(delta.total_seconds() // 60)
-            except Exception:
-                minutes_to_start = None
-        if minutes_to_start is not None and start_first_game_in_widget is not None:
-            value = max(0, minutes_to_start)
-            start_first_game_in_widget.delete(0, tk.END)
-            start_first_game_in_widget.insert(0, str(value))
-            self.variables["start_first_game_in"]["value"] = str(value)
+        self._update_start_first_game_in()
         # Set all other values normally
         for widget in self.widgets:
             entry = widget["entry"]
@@ -1758,26 +1999,25 @@ class GameManagementApp:
             if entry is not None and widget["checkbox"] is not None:
                 # Entry always sets 'value' as float-convertible string
                 value = entry.get().replace(',', '.')
-                try:
-                    # Validate it's numeric
-                    float(value)
-                    self.variables[var_name]["value"] = value
-                except ValueError:
+                if self._remember_numeric(var_name, value):
+                    var_info["value"] = value
+                else:
                     # Fallback to default if invalid
-                    self.variables[var_name]["value"] = str(var_info["default"])
+                    var_info["value"] = str(var_info["default"])
                 # Checkbox always sets 'used' as boolean
-                self.variables[var_name]["used"] = widget["checkbox"].get()
+                var_info["used"] = widget["checkbox"].get()
             elif entry is not None:
                 # Entry-only variables (no checkbox)
                 value = entry.get().replace(',', '.')
-                self.variables[var_name]["value"] = value
-                self.variables[var_name]["used"] = True
+                self._remember_numeric(var_name, value)
+                var_info["value"] = value
+                var_info["used"] = True
             elif widget["checkbox"] is not None:
                 # Checkbox-only variables (no entry)
-                self.variables[var_name]["used"] = widget["checkbox"].get()
+                var_info["used"] = widget["checkbox"].get()
             else:
                 # Neither entry nor checkbox (shouldn't happen)
-                self.variables[var_name]["used"] = True
+                var_info["used"] = True
 
     def save_sound_settings_method(self):
         return sounds_ui.save_sound_settings_method(self)
@@ -2024,7 +2264,7 @@ class GameManagementApp:
         self.update_team_timeouts_allowed()
         # team_timeouts_allowed doesn't affect game sequence structure, only UI state
         # So we don't need to rebuild the sequence
-        self.save_game_settings()
+        self._schedule_settings_flush(rebuild=False)
     
     def _on_overtime_change(self):
         """Handle overtime_allowed checkbox change."""
@@ -2033,44 +2273,37 @@ class GameManagementApp:
         # Update UI state
         self.update_overtime_variables_state()
         # Rebuild sequence and save
-        self.build_game_sequence()
-        self.save_game_settings()
+        self._schedule_settings_flush()
 
     def update_overtime_variables_state(self):
         overtime_enabled = self.overtime_allowed_var.get()
-        for widget in self.widgets:
-            name = widget.get("name", "")
-            if name in ["overtime_game_break", "overtime_half_period", "overtime_half_time_break"]:
-                label = widget.get("label_widget")
-                entry = widget.get("entry")
-                if overtime_enabled:
-                    if label:
-                        label.config(fg="black")
-                    if entry:
-                        entry.config(state="normal")
-                else:
-                    if label:
-                        label.config(fg="grey")
-                    if entry:
-                        entry.config(state="disabled")
+        for widget in self._overtime_widgets:
+            label = widget.get("label_widget")
+            entry = widget.get("entry")
+            if overtime_enabled:
+                if label:
+                    label.config(fg="black")
+                if entry:
+                    entry.config(state="normal")
+            else:
+                if label:
+                    label.config(fg="grey")
+                if entry:
+                    entry.config(state="disabled")
                         
     def create_display_window(self):
         return display_ui.create_display_window(self)
     
     def sync_display_widgets(self):
-        """Safely sync display window background colors."""
-        def sync_backgrounds():
-            try:
-                # Check if display window still exists before updating
-                if self.display_window.winfo_exists():
-                    self.display_half_label.config(bg=self.half_label.cget("bg"))
-                    self.master.after(200, sync_backgrounds)
-                # If window is closed, the loop stops automatically
-            except (tk.TclError, AttributeError, RuntimeError):
-                # Silently stop if widgets are destroyed
-                pass
-        
-        sync_backgrounds()
+        """
+        Give a newly opened display window the operator's half-label colour.
+
+        Later colour changes reach it through _set_half_bg.
+        """
+        try:
+            self.display_half_label.config(bg=self.half_label.cget("bg"))
+        except (tk.TclError, AttributeError):
+            pass
     
     def reset_timer(self):
         self.white_score_var.set(0)
@@ -2110,20 +2343,12 @@ class GameManagementApp:
         self.update_timer_display()
 
         # Sync court time to local computer time at reset/startup.
-        now = datetime.datetime.now()
-        self.court_time_seconds = (
-            now.hour * 3600 +
-            now.minute * 60 +
-            now.second
-        )
+        self.court_time_seconds = _now_seconds_of_day()
 
         self.court_time_paused = False
+        self._restart_court_time_clock()
 
-        hours, remainder = divmod(self.court_time_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        self.court_time_var.set(
-            f"Court Time is {hours:02d}:{minutes:02d}:{seconds:02d}"
-        )
+        self._show_court_time()
 
         self.update_court_time()
         self.start_current_period()
@@ -2134,57 +2359,63 @@ class GameManagementApp:
             self.court_time_job = None
 
         if self.court_time_seconds is None:
-            now = datetime.datetime.now()
-            self.court_time_seconds = (
-                now.hour * 3600 +
-                now.minute * 60 +
-                now.second
-            )
+            self.court_time_seconds = _now_seconds_of_day()
+
+        mark = time.monotonic()
 
+        # Time spent paused is dropped rather than added on resume.
         if not self.court_time_paused:
-            self.court_time_seconds += 1
+            self._court_time_fraction += mark - self._court_time_mark
+            whole_seconds = int(self._court_time_fraction)
+            self.court_time_seconds += whole_seconds
+            self._court_time_fraction -= whole_seconds
 
-        hours, remainder = divmod(self.court_time_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
+        self._court_time_mark = mark
 
-        self.court_time_var.set(
-            f"Court Time is {hours:02d}:{minutes:02d}:{seconds:02d}"
-        )
+        self._show_court_time()
 
+        # Aim the next tick at the next whole court-time second, since
+        # after() delays run long under load.
         self.court_time_job = self.master.after(
-            1000,
+            max(1, int((1.0 - self._court_time_fraction) * 1000)),
             self.update_court_time
         )
 
+    def _restart_court_time_clock(self):
+        """Start counting court time from now, discarding any part second."""
+        self._court_time_mark = time.monotonic()
+        self._court_time_fraction = 0.0
+
+    def _show_court_time(self):
+        hours, remainder = divmod(self.court_time_seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        text = _COURT_TIME_FMT(hours, minutes, seconds)
+
+        # Setting a StringVar redraws its labels even when the text is the
+        # same, as it is every tick while court time is paused.
+        if text != self._court_time_text:
+            self._court_time_text = text
+            self.court_time_var.set(text)
+
     def update_timer_display(self):
         if self.referee_timeout_active:
-            self.timer_var.set(
-                self.engine.format_seconds_as_mmss(
-                    self.referee_timeout_elapsed
-                )
-            )
-            return
+            seconds = self.referee_timeout_elapsed
+        else:
+            cur_period = self.engine.get_current_period()
 
-        cur_period = self.engine.get_current_period()
+            if cur_period and self.engine.is_sudden_death(cur_period["name"]):
+                seconds = self.engine.sudden_death_seconds
+            else:
+                seconds = self.engine.timer_seconds
 
-        if cur_period and self.engine.is_sudden_death(cur_period["name"]):
-            self.timer_var.set(
-                self.engine.format_seconds_as_mmss(
-                    self.engine.sudden_death_seconds
-                )
-            )
-            return
+        text = self.engine.format_seconds_as_mmss(seconds)
 
-        self.timer_var.set(
-            self.engine.format_seconds_as_mmss(
-                self.engine.timer_seconds
-            )
-        )
+        if text != self._timer_text:
+            self._timer_text = text
+            self.timer_var.set(text)
         
     def adjust_between_game_break_for_crib_time(self):
-        current_court_time = datetime.datetime.now() - datetime.timedelta(seconds=self.court_time_seconds)
-        local_time = datetime.datetime.now()
-        seconds_behind = int((local_time - current_court_time).total_seconds())
+        seconds_behind = int(_now_seconds_of_day() - self.court_time_seconds)
         if seconds_behind <= 0:
             return
         crib_time_var = self.variables['crib_time']
@@ -2244,12 +2475,7 @@ class GameManagementApp:
                 "between_game_break"
             )
 
-            now = datetime.datetime.now()
-            local_seconds = (
-                now.hour * 3600
-                + now.minute * 60
-                + now.second
-            )
+            local_seconds = _now_seconds_of_day()
             court_seconds = self.court_time_seconds
 
             if local_seconds > court_seconds:
@@ -2472,9 +2698,9 @@ class GameManagementApp:
 
             current_game = self.get_current_game_number()
 
-            if current_game in self.game_numbers:
-                current_index = self.game_numbers.index(current_game)
-            else:
+            current_index = self._game_num_to_idx.get(current_game)
+
+            if current_index is None:
                 current_index = int(
                     getattr(self, "current_game_index", 0)
                 )
@@ -2668,7 +2894,12 @@ class GameManagementApp:
     def white_team_timeout(self, preserve_saved_state=False):
         period = self.engine.get_current_period()
         # Immediately grey out (disable) the button when pressed
-        self.white_timeout_button.config(state=tk.DISABLED, bg="#d3d3d3", fg="#888")
+        self._set_widget_options(
+            self.white_timeout_button,
+            state=tk.DISABLED,
+            bg="#d3d3d3",
+            fg="#888"
+        )
         if period['type'] != 'regular' or not self.team_timeouts_allowed_var.get():
             return
         if self.in_timeout:
@@ -2703,7 +2934,12 @@ class GameManagementApp:
     def black_team_timeout(self, preserve_saved_state=False):
         period = self.engine.get_current_period()
         # Immediately grey out (disable) the button when pressed
-        self.black_timeout_button.config(state=tk.DISABLED, bg="#d3d3d3", fg="#888")
+        self._set_widget_options(
+            self.black_timeout_button,
+            state=tk.DISABLED,
+            bg="#d3d3d3",
+            fg="#888"
+        )
         if period['type'] != 'regular' or not self.team_timeouts_allowed_var.get():
             return
         if self.in_timeout:
@@ -2804,7 +3040,7 @@ class GameManagementApp:
         self.engine.current_index = state["current_index"]
 
         self.half_label_var.set(state["half_label"])
-        self.half_label.config(bg=state["half_label_bg"])
+        self._set_half_bg(state["half_label_bg"])
         self.update_timer_display()
 
         if self.timer_job:
@@ -2829,6 +3065,46 @@ class GameManagementApp:
         elif self.engine.timer_running:
             self.timer_job = self.master.after(1000, self.countdown_timer)
 
+    def _grid_if_changed(self, widget, **options):
+        """Grid a widget unless it is already placed with these options."""
+        key = str(widget)
+
+        if self._grid_state.get(key) != options:
+            widget.grid(**options)
+            self._grid_state[key] = options
+
+    def _grid_remove_if_shown(self, widget):
+        """grid_remove a widget unless it is already known to be hidden."""
+        key = str(widget)
+
+        if self._grid_state.get(key, False) is not None:
+            widget.grid_remove()
+            self._grid_state[key] = None
+
+    def _set_widget_options(self, widget, **options):
+        """Configure only the options whose value actually changes."""
+        changed = {
+            key: value
+            for key, value in options.items()
+            if str(widget.cget(key)) != str(value)
+        }
+
+        if changed:
+            widget.config(**changed)
+
+    def _set_half_bg(self, bg):
+        """Colour the half label and its display-window copy together."""
+        if self.half_label.cget("bg") == bg:
+            return
+        self.half_label.config(bg=bg)
+        display_half_label = getattr(self, "display_half_label", None)
+        if display_half_label is not None:
+            try:
+                display_half_label.config(bg=bg)
+            except tk.TclError:
+                # The display window has been closed
+                pass
+
     def save_timer_state(self):
     
         self.engine.saved_state = {
@@ -2873,25 +3149,12 @@ class GameManagementApp:
         }
         internal_name = period_name.lower().replace(" ", "_")
         if "time_out" in internal_name or internal_name in red_periods:
-            self.half_label.config(bg="red")
+            self._set_half_bg("red")
         else:
-            self.half_label.config(bg="lightblue")
+            self._set_half_bg("lightblue")
 
     def convert_duration_to_seconds(self, duration):
-        if duration == "1 minute":
-            return 60
-        elif duration == "2 minutes":
-            return 120
-        elif duration == "5 minutes":
-            return 300
-        elif duration in (
-            "Total Dismissal",
-            "Rest of the match"
-        ):
-            # Accept the former wording for compatibility with any
-            # existing saved data, but use Total Dismissal in the UI.
-            return -1
-        return 0
+        return _PENALTY_DURATION_SECONDS.get(duration, 0)
 
     def start_penalty_timer(self, team, cap, duration):
         seconds = self.convert_duration_to_seconds(duration)
@@ -2905,7 +3168,9 @@ class GameManagementApp:
             "timer_job": None,
             "is_rest_of_match": seconds == -1
         }
+        display_manager.set_penalty_sort_key(penalty)
         self.engine.active_penalties.append(penalty)
+        self.engine.mark_penalties_changed()
         self.engine.stored_penalties.append({"team": team, "cap": cap, "duration": duration})
         
         # Log the penalty start
@@ -2914,6 +3179,7 @@ class GameManagementApp:
         self.update_penalty_display()
         if not penalty["is_rest_of_match"]:
             self.schedule_penalty_countdown(penalty)
+            self._wake_penalty_window()
         return True
 
     def schedule_penalty_countdown(self, penalty):
@@ -2938,6 +3204,8 @@ class GameManagementApp:
             return
         if penalty["seconds_remaining"] > 0:
             penalty["seconds_remaining"] -= 1
+            penalty["_sortkey"] = penalty["seconds_remaining"]
+            self.engine.mark_penalties_changed()
             # Check if penalty just expired (reached 0)
             if penalty["seconds_remaining"] == 0:
                 # Immediately remove the expired penalty
@@ -2956,6 +3224,7 @@ class GameManagementApp:
                 self.master.after_cancel(penalty["timer_job"])
                 penalty["timer_job"] = None
             self.engine.active_penalties.remove(penalty)
+            self.engine.mark_penalties_changed()
             for stored in self.engine.stored_penalties[:]:
                 if (stored["team"] == penalty["team"] and 
                     stored["cap"] == penalty["cap"] and 
@@ -2964,11 +3233,13 @@ class GameManagementApp:
                     break
             # Ensure widget display updates after ALL removals
             self.update_penalty_display()
+            self._wake_penalty_window()
 
     def clear_all_penalties(self):
         for penalty in self.engine.active_penalties[:]:
             self.remove_penalty(penalty)
         self.update_penalty_display()
+        self._wake_penalty_window()
 
     def pause_all_penalty_timers(self):
         self.penalty_timers_paused = True
@@ -2984,6 +3255,10 @@ class GameManagementApp:
             if not penalty["is_rest_of_match"] and penalty["seconds_remaining"] > 0:
                 self.schedule_penalty_countdown(penalty)
         self.update_penalty_display()
+        self._wake_penalty_window()
+
+    def _wake_penalty_window(self):
+        return penalties_ui.wake_penalty_window(self)
 
     def show_cap_number_dialog(self, trigger_button=None):
         """
@@ -3139,12 +3414,7 @@ class GameManagementApp:
         if not self.referee_timeout_active:
             self.referee_timeout_active = True
 
-            self.referee_timeout_button.config(
-                bg=self.referee_timeout_active_bg,
-                fg=self.referee_timeout_active_fg,
-                activebackground=self.referee_timeout_active_bg,
-                activeforeground=self.referee_timeout_active_fg
-            )
+            self.referee_timeout_button.config(**self._ref_on_cfg)
 
             self.engine.saved_state = {
                 "timer_seconds": self.engine.timer_seconds,
@@ -3174,7 +3444,7 @@ class GameManagementApp:
             self.referee_timeout_elapsed = 0
 
             self.half_label_var.set("Ref Time-Out")
-            self.half_label.config(bg="red")
+            self._set_half_bg("red")
 
             self.referee_timeout_timer_label.grid()
 
@@ -3195,12 +3465,7 @@ class GameManagementApp:
         else:
             self.referee_timeout_active = False
 
-            self.referee_timeout_button.config(
-                bg=self.referee_timeout_default_bg,
-                fg=self.referee_timeout_default_fg,
-                activebackground=self.referee_timeout_default_bg,
-                activeforeground=self.referee_timeout_default_fg
-            )
+            self.referee_timeout_button.config(**self._ref_off_cfg)
 
             self.referee_timeout_timer_label.grid_remove()
 
@@ -3229,8 +3494,8 @@ class GameManagementApp:
             self.half_label_var.set(
                 self.engine.saved_state["half_label_text"]
             )
-            self.half_label.config(
-                bg=self.engine.saved_state["half_label_bg"]
+            self._set_half_bg(
+                self.engine.saved_state["half_label_bg"]
             )
 
             self.court_time_paused = self.engine.saved_state.get(
@@ -3271,6 +3536,8 @@ class GameManagementApp:
                 )
 
             if not self.court_time_paused:
+                # Court time did not run during the referee time-out.
+                self._restart_court_time_clock()
                 self.court_time_job = self.master.after(
                     1000,
                     self.update_court_time
@@ -3523,8 +3790,7 @@ def start_zigbee2mqtt():
 
 if __name__ == "__main__":
     # Check and start Zigbee2MQTT if needed (Linux/Raspberry Pi only)
-    import platform
-    if platform.system() == 'Linux':
+    if _SYSTEM == 'Linux':
         start_zigbee2mqtt()
     
     root = tk.Tk()
@@ -3532,11 +3798,20 @@ if __name__ == "__main__":
     
     def on_closing():
         """Handle application shutdown."""
+        # Write out any settings or preset edit still waiting on its
+        # debounce before anything else can fail and skip it.
+        try:
+            app._flush_settings()
+        except Exception as e:
+            print(f"Error saving settings: {e}")
+        app._flush_preset_save()
         try:
             # Stop connection watchdog
             app.stop_connection_watchdog()
             # Stop Zigbee controller
             app.zigbee_controller.stop()
+            # Flush and close the game event log
+            game_logging.close_event_log()
         except Exception as e:
             print(f"Error during cleanup: {e}")
         finally:
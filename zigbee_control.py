@@ -1,13 +1,21 @@
 from tkinter import messagebox
 
 
+def _config_if_built(app, name, **options):
+    """Configure a Zigbee tab widget, if the tab has been built yet."""
+    widget = getattr(app, name, None)
+
+    if widget is not None:
+        widget.config(**options)
+
+
 def start_zigbee_connection(app):
     app.user_initiated_action = True
     app.stop_connection_watchdog()
 
     try:
         if app.zigbee_controller.start():
-            app.toggle_connection_btn.config(text="Disconnect", state="normal")
+            _config_if_built(app, "toggle_connection_btn", text="Disconnect", state="normal")
             app.add_to_zigbee_log("Starting Zigbee connection...")
         else:
             app.add_to_zigbee_log("Failed to start Zigbee connection")
@@ -31,7 +39,7 @@ def stop_zigbee_connection(app):
 
     try:
         app.zigbee_controller.stop()
-        app.toggle_connection_btn.config(text="Connect", state="normal")
+        _config_if_built(app, "toggle_connection_btn", text="Connect", state="normal")
         app.add_to_zigbee_log("Zigbee connection stopped")
     except Exception as e:
         app.add_to_zigbee_log(f"Error stopping connection: {e}")
@@ -79,7 +87,10 @@ def start_connection_watchdog(app):
     app.user_initiated_action = False
     app.add_to_zigbee_log("Starting connection watchdog...")
 
-    app.schedule_connection_check()
+    # Reconnection attempts are driven by "disconnected" status
+    # callbacks from the controller rather than by a polling timer.
+    if not app.zigbee_controller.connected:
+        app.schedule_connection_check()
 
 
 def stop_connection_watchdog(app):
@@ -95,19 +106,24 @@ def stop_connection_watchdog(app):
 
 
 def schedule_connection_check(app):
+    """Schedule a single reconnect attempt with exponential backoff."""
     if not app.connection_watchdog_active:
         return
 
     if app.connection_watchdog_job:
         app.master.after_cancel(app.connection_watchdog_job)
 
+    backoff_ms = min(60000, 1000 * 2 ** app.connection_watchdog_attempts)
+
     app.connection_watchdog_job = app.master.after(
-        10000,
+        backoff_ms,
         app.check_connection_status
     )
 
 
 def check_connection_status(app):
+    app.connection_watchdog_job = None
+
     if not app.connection_watchdog_active or app.user_initiated_action:
         return
 
@@ -125,9 +141,10 @@ def check_connection_status(app):
             f"{app.connection_watchdog_max_attempts}"
         )
 
+        # The next attempt is scheduled when the controller reports
+        # that this one failed.
         try:
             app.zigbee_controller.start()
-            app.schedule_connection_check()
         except Exception as e:
             app.add_to_zigbee_log(f"Watchdog connection error: {e}")
             app.schedule_connection_check()
@@ -137,7 +154,7 @@ def check_connection_status(app):
             f"Watchdog: Max connection attempts "
             f"({app.connection_watchdog_max_attempts}) reached. Giving up."
         )
-        app.toggle_connection_btn.config(text="Connect", state="normal")
+        _config_if_built(app, "toggle_connection_btn", text="Connect", state="normal")
         app.stop_connection_watchdog()
 
 
@@ -145,8 +162,8 @@ def update_zigbee_status(app, connected: bool, message: str = ""):
     try:
         if connected:
             status_text = "Connected"
-            app.zigbee_status_label.config(fg="green")
-            app.toggle_connection_btn.config(text="Disconnect", state="normal")
+            _config_if_built(app, "zigbee_status_label", fg="green")
+            _config_if_built(app, "toggle_connection_btn", text="Disconnect", state="normal")
 
             if app.connection_watchdog_active and not app.user_initiated_action:
                 app.add_to_zigbee_log("Watchdog: Connection established successfully")
@@ -154,14 +171,21 @@ def update_zigbee_status(app, connected: bool, message: str = ""):
 
         else:
             status_text = "Disconnected"
-            app.zigbee_status_label.config(fg="red")
+            _config_if_built(app, "zigbee_status_label", fg="red")
 
             if not app.connection_watchdog_active or (
                 app.connection_watchdog_attempts >= app.connection_watchdog_max_attempts
             ):
-                app.toggle_connection_btn.config(text="Connect", state="normal")
+                _config_if_built(app, "toggle_connection_btn", text="Connect", state="normal")
             else:
-                app.toggle_connection_btn.config(text="Disconnect", state="normal")
+                _config_if_built(app, "toggle_connection_btn", text="Disconnect", state="normal")
+
+            if (
+                app.connection_watchdog_active
+                and not app.user_initiated_action
+                and not app.connection_watchdog_job
+            ):
+                app.schedule_connection_check()
 
         app.zigbee_status_var.set(status_text)
 
@@ -233,7 +233,7 @@ class ZigbeeSirenController:
             unified_settings["zigbeeSettings"] = config
 
             with open(settings_path, "w", encoding="utf-8") as f:
-                json.dump(unified_settings, f, indent=2)
+                f.write(json.dumps(unified_settings, indent=2))
 
             self.config = config
 
@@ -5,16 +5,43 @@ import webbrowser
 from zigbee_siren import is_mqtt_available
 
 
+def add_zigbee_siren_tab(app):
+    """
+    Add the Zigbee Siren notebook page without its contents.
+
+    The page is filled in by create_zigbee_siren_tab the first time it is
+    shown, so its widgets do not slow down startup.
+    """
+    app.zigbee_tab = ttk.Frame(app.notebook)
+    app.notebook.add(app.zigbee_tab, text="Zigbee Siren")
+    app._zigbee_tab_built = False
+
+    if not is_mqtt_available():
+        app.add_to_zigbee_log(
+            "WARNING: paho-mqtt library not installed. "
+            "Install with: pip install paho-mqtt"
+        )
+
+
+def ensure_zigbee_siren_tab(app):
+    if app._zigbee_tab_built:
+        return
+
+    app._zigbee_tab_built = True
+    create_zigbee_siren_tab(app)
+
+
 def create_zigbee_siren_tab(app):
-    """Create the Zigbee Siren configuration tab."""
-    tab = ttk.Frame(app.notebook)
-    app.notebook.add(tab, text="Zigbee Siren")
+    """Build the Zigbee Siren configuration tab into its notebook page."""
+    tab = app.zigbee_tab
 
-    label_font = ("Arial", 11)
-    label_bold_font = ("Arial", 11, "bold")
-    entry_font = ("Arial", 10)
-    button_font = ("Arial", 9)
-    small_button_font = ("Arial", 9)
+    # Shared named fonts, so Tk resolves each style once for the tab.
+    fonts = app.zigbee_fonts
+    label_font = fonts["label"]
+    label_bold_font = fonts["label_bold"]
+    entry_font = fonts["entry"]
+    button_font = fonts["small"]
+    small_button_font = fonts["small"]
 
     tab.grid_rowconfigure(0, weight=1)
     tab.grid_columnconfigure(0, weight=1)
@@ -27,14 +54,10 @@ def create_zigbee_siren_tab(app):
     )
     main_frame.grid(row=0, column=0, sticky="nsew", padx=8, pady=8)
 
-    for r in range(5):
-        main_frame.grid_rowconfigure(r, weight=0)
-
+    main_frame.grid_rowconfigure((0, 1, 2), weight=0)
     main_frame.grid_rowconfigure(3, weight=1)
     main_frame.grid_rowconfigure(4, weight=4)
-
-    for c in range(4):
-        main_frame.grid_columnconfigure(c, weight=1)
+    main_frame.grid_columnconfigure(tuple(range(4)), weight=1)
 
     status_frame = tk.LabelFrame(
         main_frame,
@@ -52,7 +75,7 @@ def create_zigbee_siren_tab(app):
         status_frame,
         textvariable=app.zigbee_status_var,
         font=label_font,
-        fg="red"
+        fg="green" if app.zigbee_status_var.get() == "Connected" else "red"
     )
     app.zigbee_status_label.grid(row=0, column=1, sticky="w", padx=8, pady=4)
 
@@ -95,7 +118,7 @@ def create_zigbee_siren_tab(app):
     app.hardware_ports_label = tk.Label(
         status_frame,
         text=f"Hardware Ports: Arduino={app.arduino_port}  Zigbee={app.zigbee_port}",
-        font=("Arial", 9),
+        font=fonts["small"],
         fg="blue"
     )
     app.hardware_ports_label.grid(
@@ -119,9 +142,19 @@ def create_zigbee_siren_tab(app):
     )
     status_button_frame.grid_columnconfigure(0, weight=1)
 
+    # Match the label update_zigbee_status would have given the button
+    # had the tab existed before the connection state last changed.
+    if getattr(app.zigbee_controller, "connected", False) or (
+        app.connection_watchdog_active
+        and app.connection_watchdog_attempts < app.connection_watchdog_max_attempts
+    ):
+        toggle_text = "Disconnect"
+    else:
+        toggle_text = "Connect"
+
     app.toggle_connection_btn = tk.Button(
         status_button_frame,
-        text="Connect",
+        text=toggle_text,
         font=small_button_font,
         height=1,
         width=18,
@@ -218,8 +251,9 @@ def create_zigbee_siren_tab(app):
         font=entry_font
     ).grid(row=row, column=0, sticky="w", padx=5, pady=2)
 
-    if "siren_button_devices" in config and isinstance(config["siren_button_devices"], list):
-        device_value = ", ".join(config["siren_button_devices"])
+    siren_button_devices = config.get("siren_button_devices")
+    if isinstance(siren_button_devices, list):
+        device_value = ", ".join(siren_button_devices)
     else:
         device_value = config.get("siren_button_device", "")
 
@@ -260,8 +294,7 @@ def create_zigbee_siren_tab(app):
     button_row_frame = tk.Frame(main_frame)
     button_row_frame.grid(row=2, column=0, columnspan=4, sticky="ew", padx=5, pady=5)
 
-    for c in range(4):
-        button_row_frame.grid_columnconfigure(c, weight=1)
+    button_row_frame.grid_columnconfigure(tuple(range(4)), weight=1)
 
     save_config_btn = tk.Button(
         button_row_frame,
@@ -322,7 +355,7 @@ def create_zigbee_siren_tab(app):
     info_text_widget = tk.Text(
         info_scroll_frame,
         height=5,
-        font=("Arial", 9),
+        font=fonts["small"],
         wrap=tk.WORD,
         yscrollcommand=info_scrollbar.set
     )
@@ -398,7 +431,7 @@ Usage:
     app.log_text = tk.Text(
         log_scroll_frame,
         height=10,
-        font=("Courier", 9),
+        font=fonts["log"],
         wrap=tk.WORD,
         state=tk.DISABLED
     )
@@ -423,10 +456,17 @@ Usage:
     )
     clear_log_btn.grid(row=1, column=0, pady=2)
 
+    # Messages logged before the tab was built were held back for it.
+    backlog = app._zigbee_log_backlog
+    app._zigbee_log_backlog = []
+
+    if backlog:
+        app.log_text.config(state=tk.NORMAL)
+        app.log_text.insert(tk.END, "".join(backlog))
+        app.log_text.see(tk.END)
+        app.log_text.config(state=tk.DISABLED)
+
     app.add_to_zigbee_log("Zigbee Siren tab initialized")
 
-    if not is_mqtt_available():
-        app.add_to_zigbee_log(
-            "WARNING: paho-mqtt library not installed. "
-            "Install with: pip install paho-mqtt"
-        )
+    # The hardware monitor skipped these labels while they did not exist.
+    app.update_usb_dongle_status()